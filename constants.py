@@ -16,6 +16,9 @@ METERS_PER_KT = 1852
 #Nautical miles per degree
 KTS_PER_DEGREE = 60
 
+#Mean radius of the Earth in meters (for quick spherical distances)
+EARTH_RADIUS_METERS = 6371000
+
 #Number of multiples of radius of maximum winds to download
 MAX_RMW_MULT = 5
 
@@ -2,44 +2,48 @@
 Helper functions for working with GLM data from Google Cloud Storage stored as NetCDF files.
 """
 
-from .glm_helpers import (
-    process_glm_info_for_hurricane,
-    process_all_hurricanes_glm
-)
-from .time_helpers import get_bins_midpoint_times, get_bins_start_times, get_bins_end_times
-from .ships_helpers import save_ships_data, interpolate_ships_info_for_hurricane, interpolate_all_hurricanes_ships
-from .hurricane_helpers import (
-    list_all_hurricanes,
-    get_hurricane_bin_midpoint_times,
-    get_hurricane_bin_start_times,
-    get_hurricane_bin_end_times,
-    interpolate_besttrack_for_code,
-    interpolate_all_hurricanes_besttrack
-)
-from .orchestration_helpers import (
-    download_all_data_for_hurricane,
-    download_all_data_for_all_hurricanes
-)
-
-__all__ = [
-    'get_bins_midpoint_times',
-    'get_bins_start_times',
-    'get_bins_end_times',
-
-    'process_glm_info_for_hurricane',
-    'process_all_hurricanes_glm',
-
-    'save_ships_data',
-    'interpolate_ships_info_for_hurricane',
-    'interpolate_all_hurricanes_ships',
-
-    'list_all_hurricanes',
-    'get_hurricane_bin_midpoint_times',
-    'get_hurricane_bin_start_times',
-    'get_hurricane_bin_end_times',
-    'interpolate_besttrack_for_code',
-    'interpolate_all_hurricanes_besttrack',
-
-    'download_all_data_for_hurricane',
-    'download_all_data_for_all_hurricanes'
-]
+from importlib import import_module
+
+# Submodule that defines each exported function. Submodules are only imported
+# the first time one of their functions is used, so importing the package
+# doesn't load every heavy dependency (h5py, pyproj, google-cloud-storage, ...)
+_EXPORTS = {
+    'get_bins_midpoint_times': '.time_helpers',
+    'get_bins_start_times': '.time_helpers',
+    'get_bins_end_times': '.time_helpers',
+    'get_list_of_hours_between_dates': '.time_helpers',
+
+    'process_glm_info_for_hurricane': '.glm_helpers',
+    'process_all_hurricanes_glm': '.glm_helpers',
+
+    'save_ships_data': '.ships_helpers',
+    'interpolate_ships_info_for_hurricane': '.ships_helpers',
+    'interpolate_all_hurricanes_ships': '.ships_helpers',
+
+    'list_all_hurricanes': '.hurricane_helpers',
+    'get_hurricane_bin_midpoint_times': '.hurricane_helpers',
+    'get_hurricane_bin_start_times': '.hurricane_helpers',
+    'get_hurricane_bin_end_times': '.hurricane_helpers',
+    'interpolate_besttrack_for_code': '.hurricane_helpers',
+    'interpolate_all_hurricanes_besttrack': '.hurricane_helpers',
+
+    'download_all_data_for_hurricane': '.orchestration_helpers',
+    'download_all_data_for_all_hurricanes': '.orchestration_helpers'
+}
+
+__all__ = list(_EXPORTS)
+
+def __getattr__(name):
+    """
+    Import exported functions from their submodule on first access.
+    """
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
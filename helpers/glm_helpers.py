@@ -1,124 +1,270 @@
 """
 Helper functions for GLM data.
 """
+import io
 import math
 import os
-import shutil
+import threading
 import pandas as pd
 import numpy as np
-import fsspec
 import h5py
-from datetime import datetime, timedelta
+from collections import deque
+from contextlib import nullcontext
+from itertools import islice
+from datetime import datetime, timedelta, timezone
 from google.cloud import storage
-from concurrent.futures import ThreadPoolExecutor
-from itertools import repeat
-from astropy.time import Time
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pyproj import Geod
 
+from helpers.time_helpers import get_list_of_hours_between_dates
 from helpers.hurricane_helpers import (
     get_hurricane_bin_midpoint_times,
     get_hurricane_bin_start_times,
     get_hurricane_bin_end_times,
-    interpolate_besttrack_for_code
+    interpolate_besttrack_for_code,
+    _load_hurricane_list
 )
-from constants import DEFAULT_REGION, TS_MIN, TS_MAX, GLM_BUCKET_NAME, METERS_PER_KT, KTS_PER_DEGREE
+from constants import DEFAULT_REGION, GLM_BUCKET_NAME, METERS_PER_KT, KTS_PER_DEGREE, EARTH_RADIUS_METERS
 
-def process_glm_file_h5py(url, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist, box_size, geod, cache_dir):
+#Epoch of GLM product_time (seconds since J2000, 2000-01-01 12:00:00, see the
+#GOES-R PUG L2+ volume 5)
+J2000 = datetime(2000, 1, 1, 12, 0, 0)
+
+#Number of threads reading GLM files at once for a bin (48 workers was best
+#in my testing)
+_GLM_READ_WORKERS = 48
+#Most GLM files downloaded but not yet parsed at once in each bin
+_GLM_PENDING_DOWNLOADS = 2*_GLM_READ_WORKERS
+#Number of worker processes aggregating GLM bins at once (half the cores, since
+#each one also runs _GLM_READ_WORKERS download threads). Callers running
+#several hurricanes at once split these between them
+_GLM_BIN_WORKERS = max(1, (os.cpu_count() or 2)//2)
+
+#Anonymous GCS client shared by every GCS call in this module (created on
+#first use, so its HTTP connections stay warm between calls)
+_GCS_CLIENT = None
+_GCS_CLIENT_LOCK = threading.Lock()
+
+def _get_gcs_client():
+    """
+    Get the shared anonymous GCS client, creating it on first use.
+
+    Returns:
+        Anonymous google.cloud.storage Client
+    """
+    global _GCS_CLIENT
+    #Only take the lock while the client still needs to be created
+    if _GCS_CLIENT is None:
+        with _GCS_CLIENT_LOCK:
+            if _GCS_CLIENT is None:
+                client = storage.Client.create_anonymous_client()
+                #requests only keeps 10 connections per host by default, so
+                #with more threads than that most downloads would open a new
+                #connection (and TLS handshake). Keep one per reader thread
+                client._http.mount("https://", HTTPAdapter(pool_maxsize=_GLM_READ_WORKERS))
+                _GCS_CLIENT = client
+    return _GCS_CLIENT
+
+#Buckets of the shared GCS client, keyed by bucket name
+_GCS_BUCKETS = {}
+
+def _get_bucket(bucket_name):
+    """
+    Get a bucket of the shared anonymous GCS client, creating it on first use.
+
+    Args:
+        bucket_name: Name of the GCS bucket
+
+    Returns:
+        google.cloud.storage Bucket
+    """
+    bucket = _GCS_BUCKETS.get(bucket_name)
+    if bucket is None:
+        bucket = _GCS_BUCKETS.setdefault(bucket_name, _get_gcs_client().bucket(bucket_name))
+    return bucket
+
+#Geographic datum used for lightning distances from the hurricane center
+#(created once per process on first use)
+_GEOD = None
+
+def _get_geod():
+    """
+    Get the process's WGS84 geographic datum, creating it on first use.
+
+    Returns:
+        pyproj Geod for the WGS84 ellipsoid
+    """
+    global _GEOD
+    if _GEOD is None:
+        _GEOD = Geod(ellps="WGS84")
+    return _GEOD
+
+def _download_glm_file(url):
+    """
+    Download a GLM file from GCS into memory
+
+    Args:
+        url: GCS URL of the GLM file (gs://bucket/blob_name)
+
+    Returns:
+        In-memory file object with the contents of the GLM file
+    """
+    blob_name = url.split(f"gs://{GLM_BUCKET_NAME}/", 1)[-1]
+    blob = _get_bucket(GLM_BUCKET_NAME).blob(blob_name)
+    return io.BytesIO(blob.download_as_bytes())
+
+def _read_glm_groups(f, center_lat, center_lon, glm_max_dist, box_size):
+    """
+    Read lightning group data for a lat/lon box around a hurricane center from
+    an already-downloaded GLM file
+
+    Args:
+        f: File object with the contents of the GLM file
+        center_lat: Latitude of hurricane center
+        center_lon: Longitude of hurricane center
+        glm_max_dist: Distance around hurricane center to get data (in meters)
+        box_size: Size of lat/lon box to get data (see _glm_box_size)
+
+    Returns:
+        Dictionary of group data arrays (keyed by output column name) for the
+        GLM file and lat/lon box (None if no groups are in range)
+    """
+    with h5py.File(f, "r") as ds:
+        # Get group locations from dataset (the other fields are only
+        # read for the groups that pass the location filters below)
+        lat = ds["group_lat"][:]
+        lon = ds["group_lon"][:]
+
+        # Mask to filter data by lightning lat/lon coordinates. The
+        # comparisons are and-ed into the mask in place through one
+        # scratch buffer instead of allocating a temporary for each
+        mask = np.greater_equal(lat, center_lat - box_size)
+        scratch = np.empty_like(mask)
+        mask &= np.less_equal(lat, center_lat + box_size, out=scratch)
+        mask &= np.greater_equal(lon, center_lon - box_size, out=scratch)
+        mask &= np.less_equal(lon, center_lon + box_size, out=scratch)
+
+        lat = lat[mask]
+        lon = lon[mask]
+
+        # Quick spherical (haversine) distance from storm center to
+        # drop groups in the corners of the box before the exact (and
+        # slower) geodesic calculation. The 2% margin covers the
+        # difference between the sphere and the WGS84 ellipsoid
+        lat_rad = np.radians(lat)
+        center_lat_rad = math.radians(center_lat)
+        hav = (np.sin((lat_rad - center_lat_rad)/2)**2 +
+               math.cos(center_lat_rad)*np.cos(lat_rad)*np.sin(np.radians(lon - center_lon)/2)**2)
+        approx_dist = 2*EARTH_RADIUS_METERS*np.arcsin(np.sqrt(hav))
+        near = approx_dist < glm_max_dist*1.02
+
+        # Combine with the box mask to index the full arrays
+        keep = np.flatnonzero(mask)[near]
+
+        if len(keep) == 0:
+            return None
+
+        lat = lat[near]
+        lon = lon[near]
+
+        # Read the remaining fields for the span of kept groups only
+        # (a contiguous slice read, which h5py handles much faster than
+        # a point selection), then pick out the kept groups
+        first, last = keep[0], keep[-1] + 1
+        keep_in_span = keep - first
+        area = ds["group_area"][first:last][keep_in_span]
+        energy = ds["group_energy"][first:last][keep_in_span]
+        time_offsets = ds["group_time_offset"][first:last][keep_in_span]
+        qflag = ds["group_quality_flag"][first:last][keep_in_span]
+
+        # product_time is in seconds since J2000 epoch
+        product_time = J2000 + timedelta(seconds=int(ds["product_time"][()]))
+
+        # Convert time offsets to actual time (all of the group times are
+        # saved as offsets from product_time variable). The format is
+        # documented on about page 596 here:
+        # https://www.goes-r.gov/products/docs/PUG-L2+-vol5.pdf
+        # (rounded to whole microseconds, like timedelta does)
+        offset_secs = time_offsets.astype(np.uint16).astype(np.float64)*(25/65536) - 5
+        offset_us = np.round(offset_secs*1e6).astype(np.int64)
+        time = pd.Timestamp(product_time) + pd.to_timedelta(offset_us, unit='us')
+
+        # Calculate lightning distance and direction from storm center
+        # (broadcast_to gives a zero-copy view of the storm center)
+        az, _, dist = _get_geod().inv(
+            np.broadcast_to(center_lon, lon.shape),
+            np.broadcast_to(center_lat, lat.shape),
+            lon,
+            lat
+        )
+
+        az = az % 360
+
+        #Filter by max distance
+        in_range = dist < glm_max_dist
+
+        # Compile GLM data into column arrays (the dataframe is built
+        # once for all files in aggregate_glm_data_for_urls)
+        return {
+            "Group Time": time.to_numpy()[in_range],
+            "Group Latitude": lat[in_range],
+            "Group Longitude": lon[in_range],
+            "Group Area": area[in_range],
+            "Group Energy": energy[in_range],
+            "Group Quality Flag": qflag[in_range],
+            "Distance From Hurricane Center (m)": dist[in_range],
+            "Direction from Hurricane Center (deg)": az[in_range]
+        }
+
+def _glm_box_size(center_lat, glm_max_dist):
+    """
+    Get the size of the lat/lon box that covers glm_max_dist around a hurricane
+    center. For instance, if box_size = 6 and hurricane center is at 0,0, we
+    get lightning data for the area between -6 and +6 in latitude and
+    longitude
+
+    Args:
+        center_lat: Latitude of hurricane center
+        glm_max_dist: Distance around hurricane center to get data (in meters)
+
+    Returns:
+        Box size in degrees
+    """
+    #Find glm_max_dist in units of longitude, with a slight 1.1 buffer factor
+    meters_per_degree = METERS_PER_KT*KTS_PER_DEGREE
+    return glm_max_dist/math.cos(center_lat*math.pi/180)/meters_per_degree*1.1
+
+def process_glm_file_h5py(url, center_lat, center_lon, glm_max_dist):
     """
-    Get lightning group data for a lat/lon box around a hurricane center from a
+    Get lightning group data within glm_max_dist of a hurricane center from a
     GLM file
 
     Args:
         url: URL of the GLM file
-        hurricane_code: Storm code of hurricane
-        bin_time: Midpoint time of bin for which to download GLM data
         center_lat: Latitude of hurricane center
         center_lon: Longitude of hurricane center
         glm_max_dist: Distance around hurricane center to get data (in meters)
-        box_size: Size of lat/lon box to get data. For instance, if box_size = 6
-            and hurricane center is at 0,0, we get lightning data for the area
-            between -6 and +6 in latitude and longitude)
-        geod: Geographic datum to use for calculating lightning distance from
-            hurricane center
-        cache_dir: Directory to store cached GLM files
 
     Returns:
-        Dataframe with group data for the specified GLM file and lat/lon box
+        Dictionary of group data arrays (keyed by output column name) for the
+        specified GLM file (None if no groups are in range)
     """
+    box_size = _glm_box_size(center_lat, glm_max_dist)
     try:
-        # Cache GLM file (faster to cache locally than scan over network)
-        with fsspec.open(f"simplecache::{url}", "rb", cache_storage=cache_dir) as f:
-            with h5py.File(f, "r") as ds:
-                # Get desired fields from dataset
-                lat = ds["group_lat"][:]
-                lon = ds["group_lon"][:]
-                area = ds["group_area"][:]
-                energy = ds["group_energy"][:]
-                time_offsets = ds["group_time_offset"][:]
-                qflag = ds["group_quality_flag"][:]
-
-                # Mask to filter data by lightning lat/lon coordinates
-                mask = (
-                    (lat >= center_lat - box_size) & (lat <= center_lat + box_size) &
-                    (lon >= center_lon - box_size) & (lon <= center_lon + box_size)
-                )
-                
-                lat = lat[mask]
-                lon = lon[mask]
-                area = area[mask]
-                energy = energy[mask]
-                time_offsets = time_offsets[mask]
-                qflag = qflag[mask]
-
-                if len(lat) == 0:
-                    return None
-            
-                # product_time is in seconds since J2000 epoch
-                product_time = Time("J2000").datetime + timedelta(seconds=int(ds["product_time"][()]))
-                
-                # Convert time offsets to actual time (all of the group times are
-                # saved as offsets from product_time variable). The format is
-                # documented on about page 596 here:
-                # https://www.goes-r.gov/products/docs/PUG-L2+-vol5.pdf
-                time = [product_time + timedelta(seconds=(float(np.uint16(offset))*25/65536)-5) for offset in time_offsets]
-
-                # Calculate lightning distance and direction from storm center
-                az, _, dist = geod.inv(
-                    np.full_like(lon, center_lon),
-                    np.full_like(lat, center_lat),
-                    lon,
-                    lat
-                )
-
-                az = az % 360
-
-                # Compile GLM data into dataframe
-                df = pd.DataFrame({
-                    "Hurricane Code": hurricane_code,
-                    "Bin Time": bin_time,
-                    "Group Time": time,
-                    "Group Latitude": lat,
-                    "Group Longitude": lon,
-                    "Group Area": area,
-                    "Group Energy": energy,
-                    "Group Quality Flag": qflag,
-                    "Distance From Hurricane Center (m)": dist,
-                    "Direction from Hurricane Center (deg)": az
-                })
-
-                #Filter by max distance
-                df = df[df["Distance From Hurricane Center (m)"] < glm_max_dist]
-
-                return df
+        # Download GLM file into memory (GLM files are small, so this is
+        # faster than caching to disk or scanning over network)
+        with _download_glm_file(url) as f:
+            return _read_glm_groups(f, center_lat, center_lon, glm_max_dist, box_size)
 
     except Exception as e:
         print(f"Error processing {url}: {e}")
         return None
 
-def aggregate_glm_data_for_urls(glm_urls, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist, geod, cache_dir):
+def aggregate_glm_data_for_urls(glm_urls, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist):
     """
-    Get lightning group data for a list of URLs using process_glm_file_h5py
-    function
+    Get lightning group data for a list of URLs (each file is read like in
+    process_glm_file_h5py)
 
     Args:
         glm_urls: List of URLs of GLM files to process
@@ -127,112 +273,236 @@ def aggregate_glm_data_for_urls(glm_urls, hurricane_code, bin_time, center_lat,
         center_lat: Latitude of hurricane center
         center_lon: Longitude of hurricane center
         glm_max_dist: Distance around hurricane center to get data (in meters)
-        geod: Geographic datum to use for calculating lightning distance from
-            hurricane center
-        cache_dir: Directory to store cached GLM files
 
     Returns:
         Dataframe with group data for all the listed GLM files 
     """
     
-    #Define box size for filtering GLM data (find rmw_mult_rmw_dist in units of
-    #longitude, with a slight 1.1 buffer factor)
-    meters_per_degree = METERS_PER_KT*KTS_PER_DEGREE
-    box_size = glm_max_dist/math.cos(center_lat*math.pi/180)/meters_per_degree*1.1
-
-    #Place to store individual file outputs from process_glm_file_h5py
-    dfs = []
-
-    #Parallelize individual file data reads (48 workers was best in my testing)
-    with ThreadPoolExecutor(max_workers=48) as executor:
-        for df in executor.map(process_glm_file_h5py, glm_urls, 
-                               repeat(hurricane_code), repeat(bin_time), 
-                               repeat(center_lat), repeat(center_lon), 
-                               repeat(glm_max_dist), repeat(box_size), 
-                               repeat(geod), repeat(cache_dir)):
-            if df is not None:
-                dfs.append(df)
-
-    #Concatenate GLM file outputs into one dataframe and return
+    #Define box size for filtering GLM data
+    box_size = _glm_box_size(center_lat, glm_max_dist)
+
+    #Place to store individual file outputs from _read_glm_groups
+    file_arrays = []
+
+    #Download the files in parallel threads (I/O bound) and parse each one in
+    #this thread as soon as it arrives, so parsing overlaps the remaining
+    #downloads without the parsers fighting each other for the GIL (h5py
+    #serializes HDF5 calls anyway). Bins run in separate processes, so the
+    #parsing still uses every core. Only _GLM_PENDING_DOWNLOADS files are
+    #requested ahead of the parser, so downloaded files waiting to be parsed
+    #don't pile up in memory when parsing falls behind
+    with ThreadPoolExecutor(max_workers=_GLM_READ_WORKERS) as executor:
+        urls = iter(glm_urls)
+        downloads = deque((url, executor.submit(_download_glm_file, url))
+                          for url in islice(urls, _GLM_PENDING_DOWNLOADS))
+        while downloads:
+            url, download = downloads.popleft()
+            for next_url in islice(urls, 1):
+                downloads.append((next_url, executor.submit(_download_glm_file, next_url)))
+            try:
+                with download.result() as f:
+                    arrays = _read_glm_groups(f, center_lat, center_lon, glm_max_dist, box_size)
+            except Exception as e:
+                print(f"Error processing {url}: {e}")
+                continue
+            if arrays is not None:
+                file_arrays.append(arrays)
+
+    #Concatenate GLM file outputs column by column and build one dataframe
     final_df = None
     try:
-        if dfs:
-            final_df = pd.concat(dfs, ignore_index=True)
+        if file_arrays:
+            columns = {
+                "Hurricane Code": hurricane_code,
+                "Bin Time": bin_time
+            }
+            for column in file_arrays[0]:
+                columns[column] = np.concatenate([arrays[column] for arrays in file_arrays])
+            final_df = pd.DataFrame(columns)
     except Exception as e:
-        print(f"Error concatenating GLM dataframes: {e}")
+        print(f"Error concatenating GLM data: {e}")
     return final_df
 
+#GLM file listings (manifests) loaded so far, keyed by (year, day of year).
+#Hurricanes that overlap in time share these instead of listing GCS again
+_GLM_DAY_MANIFESTS = {}
+
+#Days that ended less than this long ago may still be getting new GLM files,
+#so their manifests are listed again instead of cached
+_GLM_MANIFEST_SETTLE_TIME = timedelta(days=2)
+
+def _parse_glm_start_times(names):
+    """
+    Parse the start time of GLM files from their names.
+
+    Args:
+        names: List of GLM blob names or URLs
+
+    Returns:
+        DatetimeIndex of file start times (NaT for names that don't match the
+        expected filename format)
+    """
+    # Extract s20223140753200 from the filename, remove 's' and last char
+    start_time_strs = pd.Series(names, dtype=object).str.split('/').str[-1].str.split('_').str[3].str[1:-1]
+    return pd.DatetimeIndex(pd.to_datetime(start_time_strs, format="%Y%j%H%M%S", errors='coerce'))
+
+def _get_glm_day_manifest(year, day_of_year):
+    """
+    Get the manifest of GLM files for one day: a table with the blob name and
+    start time of every file in the day. Manifests are listed from GCS once and
+    then cached on disk (data/cache/glm_manifest) and in memory. Empty
+    manifests and days that ended within _GLM_MANIFEST_SETTLE_TIME are not
+    cached (files may still be on their way), so they are listed every time.
+
+    Args:
+        year: Year
+        day_of_year: Day of year (1-366)
+
+    Returns:
+        Dataframe with columns name (blob name) and start_ts (file start time)
+    """
+    key = (year, day_of_year)
+    manifest = _GLM_DAY_MANIFESTS.get(key)
+    if manifest is not None:
+        return manifest
+
+    manifest_dir = 'data/cache/glm_manifest'
+    manifest_path = f'{manifest_dir}/{year}_{day_of_year:03d}.parquet'
+    # Manifests saved before the day had settled (or empty ones) may be
+    # missing files, so those are listed again
+    day_end = datetime(year, 1, 1, tzinfo=timezone.utc) + timedelta(days=day_of_year)
+    settled_time = day_end + _GLM_MANIFEST_SETTLE_TIME
+    manifest = None
+    if os.path.exists(manifest_path) and os.path.getmtime(manifest_path) >= settled_time.timestamp():
+        manifest = pd.read_parquet(manifest_path)
+        if manifest.empty:
+            manifest = None
+    if manifest is None:
+        # Only ask GCS for blob names (not the full metadata) in pages of
+        # 1000, the largest page size the API allows
+        bucket = _get_bucket(GLM_BUCKET_NAME)
+        blobs = bucket.list_blobs(prefix=f"GLM-L2-LCFA/{year}/{day_of_year:03d}/",
+                                  page_size=1000,
+                                  fields="items(name),nextPageToken")
+        names = [blob.name for blob in blobs]
+        manifest = pd.DataFrame({
+            'name': pd.Series(names, dtype=object),
+            'start_ts': _parse_glm_start_times(names)
+        })
+
+        # Don't cache a listing that may still be incomplete
+        if manifest.empty or datetime.now(timezone.utc) < settled_time:
+            return manifest
+
+        # Write to a temporary file first so an interrupted run never leaves
+        # a partial manifest behind
+        os.makedirs(manifest_dir, exist_ok=True)
+        tmp_path = f'{manifest_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        manifest.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, manifest_path)
+
+    _GLM_DAY_MANIFESTS[key] = manifest
+    return manifest
+
 def _get_glm_urls_for_time_range(start_date, end_date):
     """
-    Get GCS URLs for GLM files in a time range.
-    Filters URLs by parsing the filename to extract the start time.
+    Get GCS URLs for GLM files in a time range, sorted by file start time so
+    that the URLs for any sub-range can be sliced out with a binary search.
+    Uses the cached day manifests (see _get_glm_day_manifest) and keeps the
+    files from the hours that fall between start_date and end_date.
     
     Args:
         start_date: Start datetime
         end_date: End datetime
     
     Returns:
-        List of GCS URLs to GLM files within the time range
+        Tuple of (array of GLM file URLs sorted by start time, DatetimeIndex of
+        the matching start times)
     """
-    glm_urls = []
-    current_date = start_date
-    
-    while current_date <= end_date:
-        year = current_date.year
-        day_of_year = current_date.timetuple().tm_yday
-        hour = current_date.hour
-        
-        # Construct GCS URL pattern
-        prefix = f"GLM-L2-LCFA/{year}/{str(day_of_year).zfill(3)}/{str(hour).zfill(2)}"
-        
-        # List blobs in GCS
-        client = storage.Client.create_anonymous_client()
-        bucket = client.bucket(GLM_BUCKET_NAME)
-        blobs = list(bucket.list_blobs(prefix=prefix))
-        
-        for blob in blobs:
-            url = f"gs://{GLM_BUCKET_NAME}/{blob.name}"
-            glm_urls.append(url)
-        
-        # Move to next hour
-        current_date += timedelta(hours=1)
-    
-    return glm_urls
+    #Find the days we need (GLM-L2-LCFA/YYYY/DDD/) so each day's manifest is
+    #only loaded once
+    hours = get_list_of_hours_between_dates(start_date, start_date.hour, end_date, end_date.hour)
+    days = dict.fromkeys((int(year), int(day_of_year)) for year, day_of_year, _ in hours)
+    if not days:
+        return np.array([], dtype=object), pd.DatetimeIndex([])
+    
+    #Listing is I/O bound, so load the day manifests concurrently (the client
+    #is shared across threads)
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        manifests = list(executor.map(lambda day: _get_glm_day_manifest(*day), days))
+    manifest = pd.concat(manifests, ignore_index=True)
+    
+    # Keep files from the first hour up to the end of the last hour
+    first_hour = pd.Timestamp(start_date).floor('h')
+    last_hour = pd.Timestamp(end_date).floor('h') + pd.Timedelta(hours=1)
+    start_ts = manifest['start_ts']
+    in_range = ((start_ts >= first_hour) & (start_ts < last_hour)).to_numpy()
+    
+    names = manifest['name'].to_numpy()[in_range]
+    start_times = start_ts.to_numpy()[in_range]
+    order = np.argsort(start_times, kind='stable')
+    
+    glm_urls = np.array([f"gs://{GLM_BUCKET_NAME}/{name}" for name in names[order]], dtype=object)
+    return glm_urls, pd.DatetimeIndex(start_times[order])
 
-def _filter_urls_by_time_range(urls, start_date, end_date):
+def _split_urls_by_bins(sorted_urls, start_times, bin_starts, bin_ends):
     """
-    Filter a list of GLM URLs to only include files that start within a time range.
+    Split a list of GLM URLs into the files that start within each bin.
     
     Args:
-        urls: List of GLM file URLs
-        start_date: Start datetime
-        end_date: End datetime
+        sorted_urls: Array of GLM file URLs sorted by start time (from
+            _get_glm_urls_for_time_range)
+        start_times: DatetimeIndex of the start times of sorted_urls
+        bin_starts: List of bin start datetimes
+        bin_ends: List of bin end datetimes
     
     Returns:
-        List of URLs where file start time is within the time range
+        List with, for each bin, the list of URLs whose file start time is
+        within the bin
     """
-    filtered_urls = []
-    
-    for url in urls:
-        try:
-            filename = url.split('/')[-1]
-            start_time_str = filename.split('_')[3][1:-1]  # Extract s20223140753200, remove 's' and last char
-            curr_start_time = datetime.strptime(start_time_str, "%Y%j%H%M%S")
-            
-            # Only include URLs where start time is within the desired range
-            if (curr_start_time >= start_date) and (curr_start_time < end_date):
-                filtered_urls.append(url)
-        except (IndexError, ValueError):
-            # Skip files that don't match expected format
-            continue
-    
-    return filtered_urls
+    # Binary search every bin's bounds in one call
+    los = start_times.searchsorted(pd.DatetimeIndex(bin_starts), side='left')
+    his = start_times.searchsorted(pd.DatetimeIndex(bin_ends), side='left')
+    return [sorted_urls[lo:hi].tolist() for lo, hi in zip(los, his)]
+
+def _init_glm_bin_worker():
+    """
+    Set up a worker process for _process_glm_bin. Builds the process's
+    geographic datum once and drops any GCS client (and its buckets) inherited
+    from the parent process (its connections can't be shared across processes).
+    """
+    global _GCS_CLIENT
+    _GCS_CLIENT = None
+    _GCS_BUCKETS.clear()
+    _get_geod()
+
+def _process_glm_bin(glm_urls, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist):
+    """
+    Aggregate GLM data for a single bin. Runs in a worker process set up by
+    _init_glm_bin_worker (or in the calling process when bins are aggregated
+    one at a time).
+
+    Args:
+        glm_urls: List of URLs of GLM files that start within the bin
+        hurricane_code: Storm code of hurricane
+        bin_time: Midpoint time of bin
+        center_lat: Latitude of hurricane center
+        center_lon: Longitude of hurricane center
+        glm_max_dist: Distance around hurricane center to get data (in meters)
+
+    Returns:
+        Dataframe with group data for the bin (None if there is none)
+    """
+    print(f"    Aggregating GLM data from {len(glm_urls)} files for bin {bin_time}...")
+    return aggregate_glm_data_for_urls(glm_urls, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist)
 
-def process_glm_info_for_hurricane(hurricane_code, rmw_mult=5, region=None, time_interval=30, cache_dir=None):
+def process_glm_info_for_hurricane(hurricane_code, rmw_mult=5, region=None, time_interval=30, hurricane_info=None,
+                                   bin_workers=None):
     """
     Process and aggregate GLM data for a given hurricane.
     
     For each bin, gets GLM file URLs and aggregates lightning data around the hurricane center.
+    Bins are independent, so they are processed in parallel worker processes.
     
     Args:
         hurricane_code: Hurricane code (e.g., 'AL092022')
@@ -240,21 +510,24 @@ def process_glm_info_for_hurricane(hurricane_code, rmw_mult=5, region=None, time
             of the radius of maximum winds)
         region: Region must be either "atl" (Atlantic) or "pac" (Pacific) (defaults to DEFAULT_REGION from constants)
         time_interval: Time interval in minutes for bins (default: 30)
-        cache_dir: Directory to store cached GLM files (default: None, uses temp directory)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
+        bin_workers: Number of worker processes aggregating bins (defaults to
+            _GLM_BIN_WORKERS). With 1, bins are aggregated in this process
     
     Returns:
-        Path to the saved GLM data CSV
+        Path to the saved GLM data Parquet file
     """
     if region is None:
         region = DEFAULT_REGION
     
-    # Get hurricane name and year from the hurricane list
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
+    if bin_workers is None:
+        bin_workers = _GLM_BIN_WORKERS
     
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    # Get hurricane name and year from the hurricane list
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
@@ -265,98 +538,98 @@ def process_glm_info_for_hurricane(hurricane_code, rmw_mult=5, region=None, time
     end_date = hurricane_info['end_date'].iloc[0]
     
     # Get interpolated best track data to get lat/lon for each bin
-    besttrack_interp_df = interpolate_besttrack_for_code(hurricane_code, region, time_interval)
+    besttrack_interp_df = interpolate_besttrack_for_code(hurricane_code, region, time_interval, hurricane_info)
     
     # Get bin times
-    bin_times = get_hurricane_bin_midpoint_times(hurricane_code, region, time_interval)
-    bin_starts = get_hurricane_bin_start_times(hurricane_code, region, time_interval)
-    bin_ends = get_hurricane_bin_end_times(hurricane_code, region, time_interval)
-    
-    # Create geographic datum
-    geod = Geod(ellps="WGS84")
+    bin_times = get_hurricane_bin_midpoint_times(hurricane_code, region, time_interval, hurricane_info)
+    bin_starts = get_hurricane_bin_start_times(hurricane_code, region, time_interval, hurricane_info)
+    bin_ends = get_hurricane_bin_end_times(hurricane_code, region, time_interval, hurricane_info)
     
     # Create the directory path to store the GLM data
     destination_path = f'data/storms/{hurricane_name}_{hurricane_start_year}/glm'
     os.makedirs(destination_path, exist_ok=True)
     
-    if cache_dir is None:
-        cache_dir = os.path.join(os.getcwd(), 'data', 'cache', 'glm')
-    os.makedirs(cache_dir, exist_ok=True)
-    
     print(f"Processing GLM data for {hurricane_name} ({hurricane_code})...")
     print(f"  Time range: {start_date} to {end_date}")
     print(f"  Number of bins: {len(bin_times)}")
     
-    # Get all GLM URLs for the entire hurricane time range
-    all_glm_urls = _get_glm_urls_for_time_range(start_date, end_date)
-    print(f"Found {len(all_glm_urls)} GLM URLs in total")
+    # Get all GLM URLs for the hours spanned by the hurricane, sorted by start
+    # time, and slice them down to each bin's time range
+    sorted_glm_urls, glm_start_times = _get_glm_urls_for_time_range(start_date, end_date)
+    print(f"  Found {len(sorted_glm_urls)} GLM URLs within hurricane time range")
+    glm_urls_by_bin = _split_urls_by_bins(sorted_glm_urls, glm_start_times, bin_starts, bin_ends)
     
-    # Filter URLs to only include files within the hurricane's time range
-    all_hurricane_glm_urls = _filter_urls_by_time_range(all_glm_urls, start_date, end_date)
-    print(f"  Found {len(all_hurricane_glm_urls)} GLM URLSs within hurricane time range")
+    # Index best track by bin time so each bin is a hash lookup
+    besttrack_by_time = besttrack_interp_df.set_index('Timestamp')[['Latitude', 'Longitude', 'Radius of Maximum Winds']]
     
-    # Process each bin
-    all_glm_data = []
+    # Work out the storm center and GLM files for each bin
+    bin_jobs = []
     for idx, bin_time in enumerate(bin_times):
-        print(f"  Processing bin {idx+1}/{len(bin_times)}: {bin_time}")
-        
-        bin_start = bin_starts[idx]
-        bin_end = bin_ends[idx]
+        print(f"  Preparing bin {idx+1}/{len(bin_times)}: {bin_time}")
         
         # Get hurricane center lat/lon for this bin
-        bin_besttrack = besttrack_interp_df[besttrack_interp_df['Timestamp'] == bin_time]
-        if len(bin_besttrack) == 0:
+        if bin_time not in besttrack_by_time.index:
             print(f"    Warning: No best track data for bin time {bin_time}")
             continue
+        bin_besttrack = besttrack_by_time.loc[bin_time]
         
-        center_lat = bin_besttrack['Latitude'].iloc[0]
-        center_lon = bin_besttrack['Longitude'].iloc[0]
+        center_lat = bin_besttrack['Latitude']
+        center_lon = bin_besttrack['Longitude']
 
         #Get radius of maximum winds distance (convert to meters)
-        rmw_dist = bin_besttrack['Radius of Maximum Winds'].iloc[0]*METERS_PER_KT
+        rmw_dist = bin_besttrack['Radius of Maximum Winds']*METERS_PER_KT
         #Use this to calculate maximum distance from hurricane center to save
         #GLM data
         glm_max_dist = rmw_mult*rmw_dist
         
-        # Get GLM URLs for this bin's time range (process_glm_file_h5py reads directly from GCS)
-        print(f"    Getting GLM URLs for bin {bin_time}...")
-        glm_urls = _filter_urls_by_time_range(all_hurricane_glm_urls, bin_start, bin_end)
+        # Get GLM URLs for this bin's time range (files are read directly from GCS)
+        glm_urls = glm_urls_by_bin[idx]
         
         if not glm_urls:
             print(f"    No GLM files found for bin {bin_time}")
             continue
         
-        # Aggregate GLM data for this bin
-        print(f"    Aggregating GLM data from {len(glm_urls)} files...")
-        bin_glm_data = aggregate_glm_data_for_urls(glm_urls, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist, geod, cache_dir)
-        
-        if bin_glm_data is not None and len(bin_glm_data) > 0:
-            all_glm_data.append(bin_glm_data)
-            print(f"    Found {len(bin_glm_data)} lightning groups")
+        bin_jobs.append((glm_urls, hurricane_code, bin_time, center_lat, center_lon, glm_max_dist))
+    
+    # Aggregate GLM data for the bins in parallel processes (each process
+    # still reads its bin's files with a thread pool), or one bin at a time
+    # in this process if only one worker is allowed
+    all_glm_data = []
+    bin_pool = (ProcessPoolExecutor(max_workers=bin_workers, initializer=_init_glm_bin_worker)
+                if bin_workers > 1 else nullcontext())
+    with bin_pool as executor:
+        if executor is None:
+            bin_results = (_process_glm_bin(*job) for job in bin_jobs)
         else:
-            print(f"    No lightning data for bin {bin_time}")
+            futures = [executor.submit(_process_glm_bin, *job) for job in bin_jobs]
+            bin_results = (future.result() for future in futures)
         
-        # Clear cache after each bin to free up space
-        if os.path.exists(cache_dir):
-            shutil.rmtree(cache_dir)
-            os.makedirs(cache_dir)
+        for job, bin_glm_data in zip(bin_jobs, bin_results):
+            bin_time = job[2]
+            
+            if bin_glm_data is not None and len(bin_glm_data) > 0:
+                all_glm_data.append(bin_glm_data)
+                print(f"    Found {len(bin_glm_data)} lightning groups for bin {bin_time}")
+            else:
+                print(f"    No lightning data for bin {bin_time}")
     
     # Combine all bin data
     if all_glm_data:
         merged_glm_data = pd.concat(all_glm_data, ignore_index=True)
 
-        # Save the GLM data
-        csv_path = f'{destination_path}/groups.csv'
-        merged_glm_data.to_csv(csv_path, index=False)
-        print(f"Saved GLM data to {csv_path}")
+        # Save the GLM data (Parquet is much faster to write/read than CSV for
+        # millions of groups and keeps Group Time as a timestamp)
+        parquet_path = f'{destination_path}/groups.parquet'
+        merged_glm_data.to_parquet(parquet_path, index=False, compression='snappy')
+        print(f"Saved GLM data to {parquet_path}")
         print(f"Total lightning groups: {len(merged_glm_data)}")
         
-        return csv_path
+        return parquet_path
     else:
         print(f"No GLM data found for {hurricane_name}")
         return None
 
-def process_all_hurricanes_glm(rmw_mult=5, region=None, time_interval=30, cache_dir=None):
+def process_all_hurricanes_glm(rmw_mult=5, region=None, time_interval=30):
     """
     Process GLM data for all hurricanes in the hurricane list CSV.
     
@@ -365,7 +638,6 @@ def process_all_hurricanes_glm(rmw_mult=5, region=None, time_interval=30, cache_
             of the radius of maximum winds)
         region: Region ("atl" or "pac") (defaults to DEFAULT_REGION from constants)
         time_interval: Time interval in minutes for bins (default: 30)
-        cache_dir: Directory to store cached GLM files (default: None, uses temp directory)
     
     Returns:
         Dictionary mapping hurricane codes to their GLM data paths
@@ -374,11 +646,7 @@ def process_all_hurricanes_glm(rmw_mult=5, region=None, time_interval=30, cache_
         region = DEFAULT_REGION
     
     # Load hurricane list
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
+    hurricanes_df = _load_hurricane_list(region)
     
     # Filter by region (codes starting with AL for atl, EP for pac)
     if region == "atl":
@@ -393,32 +661,20 @@ def process_all_hurricanes_glm(rmw_mult=5, region=None, time_interval=30, cache_
     
     print(f"Processing GLM data for {total} hurricanes from {region} region...")
     
-    for idx, row in hurricanes_df.iterrows():
-        code = row['code']
-        name = row['name']
+    for idx, (code, name) in enumerate(zip(hurricanes_df['code'], hurricanes_df['name'])):
         print(f"\n[{idx+1}/{total}] Processing {name} ({code})...")
         
         try:
-            csv_path = process_glm_info_for_hurricane(
+            parquet_path = process_glm_info_for_hurricane(
                 code,
                 rmw_mult=rmw_mult,
                 region=region,
-                time_interval=time_interval,
-                cache_dir=cache_dir
+                time_interval=time_interval
             )
-            if csv_path:
-                results[code] = csv_path
-            
-            # Clear cache after each hurricane to free up space
-            if cache_dir and os.path.exists(cache_dir):
-                shutil.rmtree(cache_dir)
-                os.makedirs(cache_dir)
+            if parquet_path:
+                results[code] = parquet_path
         except Exception as e:
             print(f"    Error processing {code}: {e}")
-            # Clear cache even on error
-            if cache_dir and os.path.exists(cache_dir):
-                shutil.rmtree(cache_dir)
-                os.makedirs(cache_dir)
             continue
     
     print(f"\nCompleted: Successfully processed {len(results)}/{total} hurricanes")
@@ -8,7 +8,6 @@ import pandas as pd
 import numpy as np
 
 from datetime import datetime
-from pyproj import Geod
 from helpers.time_helpers import get_bins_midpoint_times, get_bins_start_times, get_bins_end_times
 from constants import TS_MIN, TS_MAX, ATL_BEST_TRACK_URL, NE_PAC_BEST_TRACK_URL, DEFAULT_REGION
 from global_land_mask import globe
@@ -27,95 +26,59 @@ def read_best_track(bt_url):
         (filtered to TS_MIN to TS_MAX from constants)
     """
     
-    #Array to store hurricane location data
-    hurr_info_array = []
-    #Open best track file in fsspec
-    with fsspec.open(bt_url, mode="rt") as fobj:
-        #Loop through hurricanes
-        while True:
-            #Data includes a combination of timestamp data and overall hurricane
-            #data. 
-            #File format: https://www.aoml.noaa.gov/hrd/hurdat/hurdat2-format.pdf
-
-            hurr_info = fobj.readline()
-            #print(hurr_info)
-
-            #If the end of the file is reached readline() returns an empty 
-            #string.
-            if not hurr_info:
-                break
-            
-            try:
-                hurr_code, hurr_name, n_lines = hurr_info.replace(" ", "").split(",")[:-1]
-            except (ValueError, IndexError):
-                # Skip malformed header line
-                continue
-            
-            #Loop through timestamps within each hurricane
-            try:
-                n_lines_int = int(n_lines)
-            except ValueError:
-                # Skip if n_lines is not a valid integer
-                continue
-                
-            for row in range(n_lines_int):
-                timestamp_info = fobj.readline()
-                if not timestamp_info:
-                    # EOF reached unexpectedly
-                    break
-                    
-                try:
-                    ts_day, ts_min_str, record_identifier, sys_status, lat_hem, lon_hem,\
-                    max_sust, min_pres, rad34_ne, rad34_se, rad34_sw, rad34_nw,\
-                    rad50_ne, rad50_se, rad50_sw, rad50_nw, rad64_ne, rad64_se,\
-                    rad64_sw, rad64_nw, rad_mw = timestamp_info.replace(" ", "").replace("\n", "").split(",")
-                except (ValueError, IndexError):
-                    # Skip malformed timestamp line
-                    continue
-                
-                #Parse timestamps - only continue if timestamp is in desired
-                #range
-                try:
-                    ts_full = datetime.strptime((ts_day+ts_min_str),"%Y%m%d%H%M")
-                except (ValueError, TypeError):
-                    # Skip if timestamp parsing fails
-                    continue
-                    
-                if ((ts_full < TS_MIN) or (ts_full > TS_MAX)):
-                    continue
-                
-                #Parse lat/lon (convert coords with hemisphere to absolute)
-                try:
-                    if len(lat_hem) < 2:
-                        continue
-                    lat = float(lat_hem[:-1])
-                    hem = lat_hem[-1]
-                    if hem != 'N':
-                        lat *= -1
-
-                    if len(lon_hem) < 2:
-                        continue
-                    lon = float(lon_hem[:-1])
-                    hem = lon_hem[-1]
-                    if hem != 'E':
-                        lon *= -1
-                except (ValueError, IndexError):
-                    # Skip if lat/lon parsing fails
-                    continue
-
-                timestamp_info_array = [hurr_code, hurr_name, ts_full, sys_status,
-                                        lat, lon, max_sust, min_pres,
-                                        rad_mw]
-                hurr_info_array.append(timestamp_info_array)
-    
-    #Convert hurr_info_array into a dataframe
-    hurr_info_df = pd.DataFrame(hurr_info_array,
-                                columns = ['Hurricane Code', 'Hurricane Name',
-                                            'Timestamp', 'Status', 'Latitude',
-                                            'Longitude',
-                                            'Maximum Sustained Winds', 
-                                            'Minimum Pressure', 
-                                            'Radius of Maximum Winds'])
+    #Data includes a combination of timestamp data and overall hurricane
+    #data. Each hurricane has a header line (code, name, number of lines)
+    #followed by one 21-field line per timestamp.
+    #File format: https://www.aoml.noaa.gov/hrd/hurdat/hurdat2-format.pdf
+    #Parse the whole file in one pass (lines with more than 21 fields are
+    #malformed and skipped). The raw file is kept in a local cache
+    #(data/cache/best_track) so reruns don't download it again
+    with fsspec.open(f"simplecache::{bt_url}", mode="rt",
+                     simplecache={'cache_storage': 'data/cache/best_track'}) as fobj:
+        raw_df = pd.read_csv(fobj, header=None, names=range(21), dtype=str,
+                             skipinitialspace=True, on_bad_lines='skip')
+    #Only the fields we keep need their spaces stripped (code, name, date,
+    #time, status, lat, lon, winds, pressure, radius of maximum winds)
+    used_fields = [0, 1, 3, 4, 5, 6, 7, 20]
+    raw_df = raw_df[used_fields].apply(lambda col: col.str.replace(" ", "", regex=False))
+    
+    #Header lines start with the hurricane code (e.g. AL011851) - timestamp
+    #lines start with a date, even when their trailing fields are missing.
+    #Carry each hurricane's code and name down to its timestamp lines
+    is_header = raw_df[0].str.fullmatch(r'[A-Z]{2}\d{6}').fillna(False).astype(bool)
+    hurr_codes = raw_df[0].where(is_header).ffill()
+    hurr_names = raw_df[1].where(is_header).ffill()
+    
+    #Keep timestamp lines that belong to a hurricane
+    is_timestamp = ~is_header & hurr_codes.notna()
+    raw_df = raw_df[is_timestamp]
+    
+    #Parse timestamps - only keep timestamps in desired range (lines where
+    #parsing fails are skipped)
+    ts_full = pd.to_datetime(raw_df[0] + raw_df[1], format="%Y%m%d%H%M", errors='coerce')
+    
+    #Parse lat/lon (convert coords with hemisphere to absolute)
+    lat_hem = raw_df[4]
+    lon_hem = raw_df[5]
+    lat = pd.to_numeric(lat_hem.str[:-1], errors='coerce')
+    lat = lat.where(lat_hem.str[-1] == 'N', -lat)
+    lon = pd.to_numeric(lon_hem.str[:-1], errors='coerce')
+    lon = lon.where(lon_hem.str[-1] == 'E', -lon)
+    
+    valid = ts_full.between(TS_MIN, TS_MAX) & lat.notna() & lon.notna()
+    
+    #Build dataframe
+    hurr_info_df = pd.DataFrame({
+        'Hurricane Code': hurr_codes[is_timestamp],
+        'Hurricane Name': hurr_names[is_timestamp],
+        'Timestamp': ts_full,
+        'Status': raw_df[3],
+        'Latitude': lat,
+        'Longitude': lon,
+        'Maximum Sustained Winds': pd.to_numeric(raw_df[6], errors='coerce'),
+        'Minimum Pressure': pd.to_numeric(raw_df[7], errors='coerce'),
+        'Radius of Maximum Winds': pd.to_numeric(raw_df[20], errors='coerce')
+    })[valid].reset_index(drop=True)
     
     return hurr_info_df
 
@@ -136,13 +99,30 @@ def save_best_track(bt_url, region):
     os.makedirs('data/global/hurricane', exist_ok=True)
     
     csv_path = f'data/global/hurricane/{region}_all_hurricane_best_tracks_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    best_track_df.to_csv(csv_path, index=False)
+    # Write to a temporary file and rename it into place, so other processes
+    # never read a partially written file
+    tmp_path = f'{csv_path}.{os.getpid()}.tmp'
+    best_track_df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, csv_path)
     print(f"Saved best track data to {csv_path}")
+    
+    # Also save a Parquet copy, which is much faster to load back than
+    # re-parsing the CSV (see _load_best_track_csv)
+    parquet_path = csv_path.replace('.csv', '.parquet')
+    tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+    best_track_df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+    _BEST_TRACK_CACHE[region] = best_track_df
     return best_track_df
 
+#Best track data already loaded in this process, keyed by region
+_BEST_TRACK_CACHE = {}
+
 def _load_best_track_csv(region):
     """
-    Load best track CSV file, creating it if it doesn't exist.
+    Load best track CSV file, creating it if it doesn't exist. Each region is
+    only loaded once per process (later calls return the same DataFrame, so
+    callers must not modify it in place).
     
     Args:
         region: Region must be either "atl" (Atlantic) or "pac" (Pacific)
@@ -158,68 +138,30 @@ def _load_best_track_csv(region):
     else:
         raise ValueError(f"Region must be 'atl' or 'pac', got '{region}'")
     
-    # CSV file path
+    if region in _BEST_TRACK_CACHE:
+        return _BEST_TRACK_CACHE[region]
+    
+    # CSV file path (and the Parquet copy saved next to it)
     csv_path = f'data/global/hurricane/{region}_all_hurricane_best_tracks_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
+    parquet_path = csv_path.replace('.csv', '.parquet')
     
-    # Try to load CSV, create if it doesn't exist
-    if os.path.exists(csv_path):
+    # Try to load Parquet, then CSV, create if neither exists
+    if os.path.exists(parquet_path):
+        df = pd.read_parquet(parquet_path)
+        print(f"Loaded best track data from {parquet_path}")
+    elif os.path.exists(csv_path):
         df = pd.read_csv(csv_path, parse_dates=['Timestamp'])
         print(f"Loaded best track data from {csv_path}")
+        tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_path)
     else:
         print(f"CSV not found at {csv_path}, creating it...")
         df = save_best_track(bt_url, region)
     
+    _BEST_TRACK_CACHE[region] = df
     return df
 
-def _list_unique_storms(region):
-    """
-    Get list of unique hurricanes for a region.
-    
-    Args:
-        region: Region must be either "atl" (Atlantic) or "pac" (Pacific)
-    
-    Returns:
-        List of dictionaries, each representing a hurricane with:
-        - name: Hurricane name
-        - code: Hurricane code (ATCF ID)
-        - year: Start year
-        - start_date: First timestamp
-        - end_date: Last timestamp
-        - statuses_reached: Set of statuses reached
-        - entries: DataFrame of all entries for this hurricane
-    """
-    # Load CSV data (already filtered by time range when created)
-    df = _load_best_track_csv(region)
-    
-    # Group by hurricane code to get unique hurricanes
-    hurricanes = []
-    for code, group in df.groupby('Hurricane Code'):
-        # Get unique name (should be same for all entries)
-        name = group['Hurricane Name'].iloc[0]
-        
-        # Get start and end dates
-        start_date = group['Timestamp'].min()
-        end_date = group['Timestamp'].max()
-        year = start_date.year
-        
-        # Get all unique statuses reached
-        statuses_reached = set(group['Status'].unique())
-        
-        # Create a simple object-like structure
-        hurricane = {
-            'name': name,
-            'code': code,
-            'year': year,
-            'start_date': start_date,
-            'end_date': end_date,
-            'statuses_reached': statuses_reached,
-            'entries': group  # DataFrame with all entries
-        }
-        
-        hurricanes.append(hurricane)
-    
-    return hurricanes
-
 def list_all_hurricanes(region=None):
     """
     List all hurricanes with name, code, start year, dates, and statuses.
@@ -234,21 +176,26 @@ def list_all_hurricanes(region=None):
     if region is None:
         region = DEFAULT_REGION
     
-    filtered_tcs = _list_unique_storms(region)
-    hurricanes = []
-    
-    for tc in filtered_tcs:
-        if "HU" in tc['statuses_reached']:  # Only hurricanes
-            hurricanes.append({
-                "name": tc['name'],
-                "code": tc['code'],
-                "year": tc['year'],
-                "start_date": tc['start_date'],
-                "end_date": tc['end_date'],
-                "statuses_reached": ",".join(sorted(tc['statuses_reached']))
-            })
+    # Load CSV data (already filtered by time range when created)
+    df = _load_best_track_csv(region)
     
-    hurricanes_df = pd.DataFrame(hurricanes)
+    # Summarize each storm column by column (name, start/end dates, statuses
+    # reached)
+    storms = df.groupby('Hurricane Code')
+    start_dates = storms['Timestamp'].min()
+    statuses = storms['Status'].unique()
+    hurricanes_df = pd.DataFrame({
+        "name": storms['Hurricane Name'].first(),
+        "code": start_dates.index,
+        "year": start_dates.dt.year,
+        "start_date": start_dates,
+        "end_date": storms['Timestamp'].max(),
+        "statuses_reached": statuses.map(lambda storm_statuses: ",".join(sorted(storm_statuses)))
+    })
+    
+    # Only hurricanes
+    is_hurricane = statuses.map(lambda storm_statuses: "HU" in storm_statuses)
+    hurricanes_df = hurricanes_df[is_hurricane].reset_index(drop=True)
     
     # Save to CSV
     os.makedirs('data/global/hurricane', exist_ok=True)
@@ -256,10 +203,63 @@ def list_all_hurricanes(region=None):
     hurricanes_df.to_csv(csv_path, index=False)
     print(f"Saved hurricane list to {csv_path}")
     
+    # The list on disk changed, so reload it the next time it's needed
+    _HURRICANE_LIST_CACHE.pop(region, None)
+    return hurricanes_df
+
+#Hurricane lists already loaded in this process, keyed by region
+_HURRICANE_LIST_CACHE = {}
+
+def _load_hurricane_list(region):
+    """
+    Load the hurricane list CSV saved by list_all_hurricanes. Each region is
+    only read once per process (later calls return the same DataFrame, so
+    callers must not modify it in place).
+    
+    Args:
+        region: Region must be either "atl" (Atlantic) or "pac" (Pacific)
+    
+    Returns:
+        pandas.DataFrame with the hurricane list
+    """
+    if region in _HURRICANE_LIST_CACHE:
+        return _HURRICANE_LIST_CACHE[region]
+    
+    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
+    if not os.path.exists(list_csv_path):
+        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
+    
+    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'], engine='pyarrow')
+    _HURRICANE_LIST_CACHE[region] = hurricanes_df
     return hurricanes_df
 
 ## Functions to save specific hurricane best track data
 
+#Best track data split by hurricane code, keyed by region
+_BEST_TRACK_BY_CODE = {}
+
+def _best_track_by_code(region):
+    """
+    Get the best track data for a region split by hurricane code. The split
+    is done once per process, so each lookup is a dictionary access instead
+    of a scan over every storm.
+    
+    Args:
+        region: Region must be either "atl" (Atlantic) or "pac" (Pacific)
+    
+    Returns:
+        Dictionary mapping hurricane codes to their best track DataFrames
+        (shared, so callers must not modify them in place)
+    """
+    df = _load_best_track_csv(region)
+    
+    # Rebuild if the region's best track data was reloaded or re-saved
+    cached = _BEST_TRACK_BY_CODE.get(region)
+    if cached is None or cached[0] is not df:
+        cached = (df, dict(tuple(df.groupby('Hurricane Code', sort=False))))
+        _BEST_TRACK_BY_CODE[region] = cached
+    return cached[1]
+
 def get_hurricane_path(code, region=None):
     """
     Get the full best track DataFrame for a specific hurricane by code.
@@ -275,18 +275,51 @@ def get_hurricane_path(code, region=None):
     if region is None:
         region = DEFAULT_REGION
     
-    # Load the global CSV
-    df = _load_best_track_csv(region)
-    
-    # Filter by hurricane code
-    hurricane_df = df[df['Hurricane Code'] == code].copy()
+    # Look up the hurricane in the best track data split by code
+    hurricane_df = _best_track_by_code(region).get(code)
     
-    if len(hurricane_df) == 0:
+    if hurricane_df is None or len(hurricane_df) == 0:
         return None
     
-    return hurricane_df
+    return hurricane_df.copy()
 
-def interpolate_besttrack_info(besttrack_data_df, bin_times, bin_starts, bin_ends, geod, hurricane_name, hurricane_start_year):
+def _to_epoch_seconds(times):
+    """
+    Convert datetimes to seconds since the Unix epoch (naive datetimes are
+    treated as UTC, like pd.Timestamp.timestamp).
+
+    Args:
+        times: List, Series or array of datetimes
+
+    Returns:
+        NumPy array of float seconds since 1970-01-01
+    """
+    return pd.DatetimeIndex(times).to_numpy(dtype='datetime64[ns]').astype(np.int64) / 1e9
+
+def _initial_bearing(lat1, lon1, lat2, lon2):
+    """
+    Great-circle initial bearing between two sets of points on a sphere. Over
+    the few kilometers a storm moves in one bin this is within a fraction of a
+    degree of the WGS84 geodesic azimuth, without the iterative solve.
+
+    Args:
+        lat1: Array of start latitudes (degrees)
+        lon1: Array of start longitudes (degrees)
+        lat2: Array of end latitudes (degrees)
+        lon2: Array of end longitudes (degrees)
+
+    Returns:
+        Array of bearings from start to end points (degrees clockwise from
+        north, 0-360)
+    """
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlon_rad = np.radians(np.asarray(lon2) - np.asarray(lon1))
+    y = np.sin(dlon_rad)*np.cos(lat2_rad)
+    x = np.cos(lat1_rad)*np.sin(lat2_rad) - np.sin(lat1_rad)*np.cos(lat2_rad)*np.cos(dlon_rad)
+    return np.degrees(np.arctan2(y, x)) % 360
+
+def interpolate_besttrack_info(besttrack_data_df, bin_times, bin_starts, bin_ends, hurricane_name, hurricane_start_year):
     """
     Interpolate hurricane data df to get storm info at specified times.
     Lat/lon coordinates are interpolated between nearest best-track points, 
@@ -302,7 +335,6 @@ def interpolate_besttrack_info(besttrack_data_df, bin_times, bin_starts, bin_end
             needed
         bin_starts: List of start datetimes of bins
         bin_ends: List of end datetimes of bins
-        geod: Geographic datum to use for calculating storm motion direction
         hurricane_name: Name of the hurricane (e.g., "IAN")
         hurricane_start_year: Start year of the hurricane (e.g., 2022)
         
@@ -324,50 +356,52 @@ def interpolate_besttrack_info(besttrack_data_df, bin_times, bin_starts, bin_end
     besttrack_interp_df = pd.DataFrame(bin_times, columns = ['Timestamp'])
 
     #Turn timestamp lists into numerical format
-    bin_times_num = [bin_time.timestamp() for bin_time in bin_times]
-    bin_starts_num = [bin_start.timestamp() for bin_start in bin_starts]
-    bin_ends_num = [bin_end.timestamp() for bin_end in bin_ends]
-    hurricane_data_ts_num = [ts.timestamp() for ts in besttrack_data_df['Timestamp']]
-    
-    # Sort hurricane data by timestamp for interpolation (required by np.interp)
-    sort_idx = np.argsort(hurricane_data_ts_num)
-    hurricane_data_ts_num_sorted = np.array(hurricane_data_ts_num)[sort_idx]
-    hurricane_lats_sorted = besttrack_data_df['Latitude'].values[sort_idx]
-    hurricane_lons_sorted = besttrack_data_df['Longitude'].values[sort_idx]
-
-    #Nearest neighbor for hurricane status
-    besttrack_interp_df['Status'] = pd.merge_asof(besttrack_interp_df['Timestamp'], 
-                                                besttrack_data_df[["Timestamp", "Status"]], 
-                                                on="Timestamp", direction="nearest")['Status']
-
-    #Interpolate latitudes/longitudes (np.interp requires sorted x values)
-    besttrack_interp_df['Latitude'] = np.interp(bin_times_num, hurricane_data_ts_num_sorted, hurricane_lats_sorted)
-    besttrack_interp_df['Longitude'] = np.interp(bin_times_num, hurricane_data_ts_num_sorted, hurricane_lons_sorted)
+    bin_times_num = _to_epoch_seconds(bin_times)
+    bin_starts_num = _to_epoch_seconds(bin_starts)
+    bin_ends_num = _to_epoch_seconds(bin_ends)
+    hurricane_data_ts_num = _to_epoch_seconds(besttrack_data_df['Timestamp'])
+    
+    # Sort hurricane data by timestamp for interpolation (required by np.interp).
+    # Best track rows are already in time order, so only sort when they aren't
+    hurricane_data_ts_num_sorted = hurricane_data_ts_num
+    hurricane_lats_sorted = besttrack_data_df['Latitude'].values
+    hurricane_lons_sorted = besttrack_data_df['Longitude'].values
+    if np.any(np.diff(hurricane_data_ts_num) < 0):
+        sort_idx = np.argsort(hurricane_data_ts_num)
+        hurricane_data_ts_num_sorted = hurricane_data_ts_num[sort_idx]
+        hurricane_lats_sorted = hurricane_lats_sorted[sort_idx]
+        hurricane_lons_sorted = hurricane_lons_sorted[sort_idx]
+
+    #Nearest neighbor interpolation for status and other storm
+    #characteristics (all columns matched in one pass)
+    nearest_columns = ['Status', 'Maximum Sustained Winds', 'Minimum Pressure', 'Radius of Maximum Winds']
+    nearest_df = pd.merge_asof(besttrack_interp_df[['Timestamp']],
+                               besttrack_data_df[['Timestamp'] + nearest_columns],
+                               on="Timestamp", direction="nearest")
+    besttrack_interp_df['Status'] = nearest_df['Status']
+
+    #Interpolate latitudes/longitudes (np.interp requires sorted x values) at
+    #bin midpoints, starts and ends together, then split the results back up
+    query_times_num = np.concatenate([bin_times_num, bin_starts_num, bin_ends_num])
+    query_lats = np.interp(query_times_num, hurricane_data_ts_num_sorted, hurricane_lats_sorted)
+    query_lons = np.interp(query_times_num, hurricane_data_ts_num_sorted, hurricane_lons_sorted)
+    bin_lats, bin_start_lats, bin_end_lats = np.split(query_lats, 3)
+    bin_lons, bin_start_lons, bin_end_lons = np.split(query_lons, 3)
+
+    besttrack_interp_df['Latitude'] = bin_lats
+    besttrack_interp_df['Longitude'] = bin_lons
 
     #Find storm motion
     #Really janky solution - basically interpolate storm position for start and
     #end times of bin and calculate direction between those
-    bin_start_lats = np.interp(bin_starts_num, hurricane_data_ts_num_sorted, hurricane_lats_sorted)
-    bin_start_lons = np.interp(bin_starts_num, hurricane_data_ts_num_sorted, hurricane_lons_sorted)
-    bin_end_lats = np.interp(bin_ends_num, hurricane_data_ts_num_sorted, hurricane_lats_sorted)
-    bin_end_lons = np.interp(bin_ends_num, hurricane_data_ts_num_sorted, hurricane_lons_sorted)
 
-    #List to populate with storm motion directions
-    sm_dirs, _, dists = geod.inv(bin_start_lons, bin_start_lats, bin_end_lons, bin_end_lats)
-    besttrack_interp_df['Storm Motion Direction (deg)'] = sm_dirs % 360
+    #Storm motion directions (bearing from bin start to bin end position)
+    besttrack_interp_df['Storm Motion Direction (deg)'] = _initial_bearing(
+        bin_start_lats, bin_start_lons, bin_end_lats, bin_end_lons)
 
-    #Nearest neighbor interpolation for other storm characteristics
-    besttrack_interp_df['Maximum Sustained Winds'] = pd.merge_asof(besttrack_interp_df['Timestamp'], 
-                                                                besttrack_data_df[["Timestamp", "Maximum Sustained Winds"]], 
-                                                                on="Timestamp", direction="nearest")['Maximum Sustained Winds']
-    
-    besttrack_interp_df['Minimum Pressure'] = pd.merge_asof(besttrack_interp_df['Timestamp'], 
-                                                            besttrack_data_df[["Timestamp", "Minimum Pressure"]], 
-                                                            on="Timestamp", direction="nearest")['Minimum Pressure']
-    
-    besttrack_interp_df['Radius of Maximum Winds'] = pd.merge_asof(besttrack_interp_df['Timestamp'], 
-                                                                besttrack_data_df[["Timestamp", "Radius of Maximum Winds"]], 
-                                                                on="Timestamp", direction="nearest")['Radius of Maximum Winds'] 
+    #Other storm characteristics from the nearest neighbor match above
+    for column in nearest_columns[1:]:
+        besttrack_interp_df[column] = nearest_df[column]
     
     # Add column for whether storm is over land or ocean at each timestamp
     besttrack_interp_df["Land"] = besttrack_interp_df.apply(lambda r: "Y" if globe.is_land(r["Latitude"], r["Longitude"]) else "N",axis=1)
@@ -382,7 +416,7 @@ def interpolate_besttrack_info(besttrack_data_df, bin_times, bin_starts, bin_end
 
     return besttrack_interp_df
 
-def get_hurricane_bin_midpoint_times(hurricane_code, region=None, time_interval=30):
+def get_hurricane_bin_midpoint_times(hurricane_code, region=None, time_interval=30, hurricane_info=None):
     """
     Get the midpoint times of bins for a hurricane.
     
@@ -390,6 +424,8 @@ def get_hurricane_bin_midpoint_times(hurricane_code, region=None, time_interval=
         hurricane_code: Hurricane code (ATCF ID, e.g., "AL092022")
         region: Region ("atl" or "pac"). If None, determined from code (AL=atl, EP=pac)
         time_interval: Time interval in minutes for bins (default: 30)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
     
     Returns:
         List of datetime objects representing bin midpoint times
@@ -404,12 +440,9 @@ def get_hurricane_bin_midpoint_times(hurricane_code, region=None, time_interval=
             raise ValueError(f"Could not determine region from code {hurricane_code}. Please specify region.")
     
     # Load hurricane list to get start and end dates
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
@@ -419,7 +452,7 @@ def get_hurricane_bin_midpoint_times(hurricane_code, region=None, time_interval=
     
     return get_bins_midpoint_times(start_date, end_date, time_interval)
 
-def get_hurricane_bin_start_times(hurricane_code, region=None, time_interval=30):
+def get_hurricane_bin_start_times(hurricane_code, region=None, time_interval=30, hurricane_info=None):
     """
     Get the start times of bins for a hurricane.
     
@@ -427,6 +460,8 @@ def get_hurricane_bin_start_times(hurricane_code, region=None, time_interval=30)
         hurricane_code: Hurricane code (ATCF ID, e.g., "AL092022")
         region: Region ("atl" or "pac"). If None, determined from code (AL=atl, EP=pac)
         time_interval: Time interval in minutes for bins (default: 30)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
     
     Returns:
         List of datetime objects representing bin start times
@@ -441,12 +476,9 @@ def get_hurricane_bin_start_times(hurricane_code, region=None, time_interval=30)
             raise ValueError(f"Could not determine region from code {hurricane_code}. Please specify region.")
     
     # Load hurricane list to get start and end dates
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
@@ -456,7 +488,7 @@ def get_hurricane_bin_start_times(hurricane_code, region=None, time_interval=30)
     
     return get_bins_start_times(start_date, end_date, time_interval)
 
-def get_hurricane_bin_end_times(hurricane_code, region=None, time_interval=30):
+def get_hurricane_bin_end_times(hurricane_code, region=None, time_interval=30, hurricane_info=None):
     """
     Get the end times of bins for a hurricane.
     
@@ -464,6 +496,8 @@ def get_hurricane_bin_end_times(hurricane_code, region=None, time_interval=30):
         hurricane_code: Hurricane code (ATCF ID, e.g., "AL092022")
         region: Region ("atl" or "pac"). If None, determined from code (AL=atl, EP=pac)
         time_interval: Time interval in minutes for bins (default: 30)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
     
     Returns:
         List of datetime objects representing bin end times
@@ -478,12 +512,9 @@ def get_hurricane_bin_end_times(hurricane_code, region=None, time_interval=30):
             raise ValueError(f"Could not determine region from code {hurricane_code}. Please specify region.")
     
     # Load hurricane list to get start and end dates
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
@@ -493,7 +524,7 @@ def get_hurricane_bin_end_times(hurricane_code, region=None, time_interval=30):
     
     return get_bins_end_times(start_date, end_date, time_interval)
 
-def interpolate_besttrack_for_code(hurricane_code, region=None, time_interval=30):
+def interpolate_besttrack_for_code(hurricane_code, region=None, time_interval=30, hurricane_info=None):
     """
     Interpolate best track data for a hurricane given only its code.
     Automatically determines name, year, region, and creates bins.
@@ -502,6 +533,8 @@ def interpolate_besttrack_for_code(hurricane_code, region=None, time_interval=30
         hurricane_code: Hurricane code (ATCF ID, e.g., "AL092022")
         region: Region ("atl" or "pac"). If None, determined from code (AL=atl, EP=pac)
         time_interval: Time interval in minutes for bins (default: 30)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
     
     Returns:
         Dataframe containing interpolated hurricane info
@@ -517,38 +550,50 @@ def interpolate_besttrack_for_code(hurricane_code, region=None, time_interval=30
     
     # Load hurricane list to get name and year
     # Use default time range from constants for the CSV filename
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
     
-    hurricane_name = hurricane_info['name'].iloc[0]
-    hurricane_start_year = int(hurricane_info['year'].iloc[0])
-    
     # Get best track data for this hurricane using get_hurricane_path
     # get_hurricane_path uses default time range from constants
     hurricane_besttrack = get_hurricane_path(hurricane_code, region)
     
+    return _interpolate_besttrack_for_hurricane(hurricane_info.iloc[0], hurricane_besttrack, time_interval)
+
+def _interpolate_besttrack_for_hurricane(hurricane_row, hurricane_besttrack, time_interval):
+    """
+    Interpolate best track data for a hurricane whose hurricane list entry and
+    best track data are already loaded.
+    
+    Args:
+        hurricane_row: Row of the hurricane list CSV for the hurricane (any
+            mapping with 'code', 'name', 'year', 'start_date' and 'end_date')
+        hurricane_besttrack: Best track DataFrame for the hurricane (None if
+            there is no data)
+        time_interval: Time interval in minutes for bins
+    
+    Returns:
+        Dataframe containing interpolated hurricane info
+    """
+    hurricane_code = hurricane_row['code']
+    hurricane_name = hurricane_row['name']
+    hurricane_start_year = int(hurricane_row['year'])
+    
     if hurricane_besttrack is None or len(hurricane_besttrack) == 0:
         raise ValueError(f"No best track data found for hurricane code {hurricane_code}")
     
-    # Create bins using the new helper functions
-    bin_times = get_hurricane_bin_midpoint_times(hurricane_code, region, time_interval)
+    # Create bins from the hurricane's start and end dates
+    bin_times = get_bins_midpoint_times(hurricane_row['start_date'], hurricane_row['end_date'], time_interval)
     
     if len(bin_times) == 0:
         raise ValueError(f"No bins created for hurricane {hurricane_code}.")
     
     # Create bin_starts and bin_ends
-    bin_starts = get_hurricane_bin_start_times(hurricane_code, region, time_interval)
-    bin_ends = get_hurricane_bin_end_times(hurricane_code, region, time_interval)
-    
-    # Create geographic datum
-    geod = Geod(ellps="WGS84")
+    bin_starts = get_bins_start_times(hurricane_row['start_date'], hurricane_row['end_date'], time_interval)
+    bin_ends = get_bins_end_times(hurricane_row['start_date'], hurricane_row['end_date'], time_interval)
     
     # Call interpolate_besttrack_info
     return interpolate_besttrack_info(
@@ -556,7 +601,6 @@ def interpolate_besttrack_for_code(hurricane_code, region=None, time_interval=30
         bin_times,
         bin_starts,
         bin_ends,
-        geod,
         hurricane_name,
         hurricane_start_year
     )
@@ -576,11 +620,7 @@ def interpolate_all_hurricanes_besttrack(region=None, time_interval=30):
         region = DEFAULT_REGION
     
     # Load hurricane list
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
+    hurricanes_df = _load_hurricane_list(region)
     
     # Filter by region (codes starting with AL for atl, EP for pac)
     if region == "atl":
@@ -595,16 +635,23 @@ def interpolate_all_hurricanes_besttrack(region=None, time_interval=30):
     
     print(f"Processing {total} hurricanes from {region} region...")
     
-    for idx, row in hurricanes_df.iterrows():
+    # Load the best track data once and split it by hurricane (instead of
+    # reloading the full CSV for every hurricane)
+    besttrack_by_code = _best_track_by_code(region)
+    
+    # Interpolate one hurricane at a time - each one is only a few hundred
+    # bins, so a process pool costs more (spawning workers, pickling the
+    # best track rows and results) than it saves
+    for idx, row in enumerate(hurricanes_df.to_dict('records')):
         code = row['code']
         name = row['name']
         print(f"  [{idx+1}/{total}] Processing {name} ({code})...")
         
         try:
-            interp_df = interpolate_besttrack_for_code(
-                code,
-                region=region,
-                time_interval=time_interval
+            interp_df = _interpolate_besttrack_for_hurricane(
+                row,
+                besttrack_by_code.get(code),
+                time_interval
             )
             results[code] = interp_df
         except Exception as e:
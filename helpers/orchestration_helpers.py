@@ -2,15 +2,19 @@
 Helper functions for orchestrating data processing pipelines.
 """
 
-import os
-import pandas as pd
-from helpers.hurricane_helpers import interpolate_besttrack_for_code
-from helpers.ships_helpers import interpolate_ships_info_for_hurricane
-from helpers.glm_helpers import process_glm_info_for_hurricane
-from constants import TS_MIN, TS_MAX, DEFAULT_REGION, MAX_RMW_MULT
+from concurrent.futures import ProcessPoolExecutor
+from helpers.hurricane_helpers import interpolate_besttrack_for_code, _load_hurricane_list, _best_track_by_code
+from helpers.ships_helpers import interpolate_ships_info_for_hurricane, _ships_data_by_code
+from helpers.glm_helpers import process_glm_info_for_hurricane, _init_glm_bin_worker, _GLM_BIN_WORKERS
+from constants import DEFAULT_REGION, MAX_RMW_MULT
+
+# Most hurricanes processed at once by download_all_data_for_all_hurricanes.
+# The GLM bin workers (_GLM_BIN_WORKERS in total) are split between them, so
+# the machine runs about as many processes as a single hurricane would
+_HURRICANE_WORKERS = 4
 
 def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=30, 
-                                    nn_tolerance=None, cache_dir=None):
+                                    nn_tolerance=None, hurricane_info=None, glm_bin_workers=None):
     """
     Download and process all data (hurricane best track, SHIPS, and GLM) for a single hurricane.
     Processes data in order: hurricane best track -> SHIPS -> GLM.
@@ -20,14 +24,17 @@ def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=3
         region: Region ("atl" or "pac"). If None, determined from code (AL=atl, EP=pac)
         time_interval: Time interval in minutes for bins (default: 30)
         nn_tolerance: Maximum allowable time from nearest SHIPS data (defaults to DEFAULT_NN_TOLERANCE from constants)
-        cache_dir: Directory to store cached GLM files (default: None, uses temp directory)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
+        glm_bin_workers: Number of worker processes aggregating GLM bins
+            (defaults to _GLM_BIN_WORKERS from glm_helpers)
     
     Returns:
         Dictionary with paths to processed data:
         {
             'hurricane': path to besttrack.csv,
             'ships': path to ships_interpolated.csv,
-            'glm': path to groups.csv
+            'glm': path to groups.parquet
         }
     """
     # Determine region from code if not provided
@@ -40,12 +47,9 @@ def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=3
             raise ValueError(f"Could not determine region from code {hurricane_code}. Please specify region.")
     
     # Load hurricane list to get name
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
@@ -62,7 +66,7 @@ def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=3
     # Step 1: Process hurricane best track data
     print(f"\n[1/3] Processing hurricane best track data...")
     try:
-        besttrack_df = interpolate_besttrack_for_code(hurricane_code, region, time_interval)
+        besttrack_df = interpolate_besttrack_for_code(hurricane_code, region, time_interval, hurricane_info)
         # interpolate_besttrack_for_code saves the file internally
         besttrack_path = f'data/storms/{hurricane_name}_{hurricane_start_year}/hurricane/besttrack.csv'
         results['hurricane'] = besttrack_path
@@ -78,7 +82,8 @@ def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=3
             hurricane_code,
             nn_tolerance=nn_tolerance,
             region=region,
-            time_interval=time_interval
+            time_interval=time_interval,
+            hurricane_info=hurricane_info
         )
         # interpolate_ships_info_for_hurricane returns the destination directory, construct full path
         ships_path = f'{ships_dest_path}/ships_interpolated.csv'
@@ -96,7 +101,8 @@ def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=3
             rmw_mult=MAX_RMW_MULT,
             region=region,
             time_interval=time_interval,
-            cache_dir=cache_dir
+            hurricane_info=hurricane_info,
+            bin_workers=glm_bin_workers
         )
         results['glm'] = glm_path
         if glm_path:
@@ -114,16 +120,16 @@ def download_all_data_for_hurricane(hurricane_code, region=None, time_interval=3
     return results
 
 def download_all_data_for_all_hurricanes(region=None, time_interval=30, 
-                                         nn_tolerance=None, cache_dir=None):
+                                         nn_tolerance=None):
     """
     Download and process all data (hurricane best track, SHIPS, and GLM) for all hurricanes.
-    Processes data in order: hurricane best track -> SHIPS -> GLM for each hurricane.
+    Processes data in order: hurricane best track -> SHIPS -> GLM for each hurricane,
+    with several hurricanes processed in parallel.
     
     Args:
         region: Region ("atl" or "pac") (defaults to DEFAULT_REGION from constants)
         time_interval: Time interval in minutes for bins (default: 30)
         nn_tolerance: Maximum allowable time from nearest SHIPS data (defaults to DEFAULT_NN_TOLERANCE from constants)
-        cache_dir: Directory to store cached GLM files (default: None, uses temp directory)
     
     Returns:
         Dictionary mapping hurricane codes to their processed data paths:
@@ -131,7 +137,7 @@ def download_all_data_for_all_hurricanes(region=None, time_interval=30,
             'AL092022': {
                 'hurricane': path to besttrack.csv,
                 'ships': path to ships_interpolated.csv,
-                'glm': path to groups.csv
+                'glm': path to groups.parquet
             },
             ...
         }
@@ -140,11 +146,7 @@ def download_all_data_for_all_hurricanes(region=None, time_interval=30,
         region = DEFAULT_REGION
     
     # Load hurricane list
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
+    hurricanes_df = _load_hurricane_list(region)
     
     # Filter by region (codes starting with AL for atl, EP for pac)
     if region == "atl":
@@ -154,6 +156,9 @@ def download_all_data_for_all_hurricanes(region=None, time_interval=30,
     else:
         raise ValueError(f"Region must be 'atl' or 'pac', got '{region}'")
     
+    # Index by code so each hurricane's row is a hash lookup rather than a scan
+    hurricanes_df = hurricanes_df.set_index('code', drop=False)
+    
     results = {}
     total = len(hurricanes_df)
     
@@ -161,27 +166,41 @@ def download_all_data_for_all_hurricanes(region=None, time_interval=30,
     print(f"Processing all data for {total} hurricanes from {region} region")
     print(f"{'='*80}\n")
     
-    for idx, row in hurricanes_df.iterrows():
-        code = row['code']
-        name = row['name']
-        
-        try:
-            hurricane_results = download_all_data_for_hurricane(
+    # Load (creating them if needed) the region's best track and SHIPS data
+    # before starting any workers. Workers then only read finished files (and
+    # forked workers inherit the loaded data) instead of racing to download
+    # and write the same files
+    _best_track_by_code(region)
+    _ships_data_by_code(region)
+    
+    # Hurricanes are independent, so process several of them in parallel
+    # processes, splitting the GLM bin workers between them. Each worker drops
+    # any GCS client inherited from this process (like the GLM bin workers do)
+    hurricane_workers = min(_HURRICANE_WORKERS, _GLM_BIN_WORKERS)
+    glm_bin_workers = max(1, _GLM_BIN_WORKERS // hurricane_workers)
+    with ProcessPoolExecutor(max_workers=hurricane_workers, initializer=_init_glm_bin_worker) as executor:
+        futures = []
+        for code, name in zip(hurricanes_df['code'], hurricanes_df['name']):
+            futures.append((code, name, executor.submit(
+                download_all_data_for_hurricane,
                 code,
                 region=region,
                 time_interval=time_interval,
                 nn_tolerance=nn_tolerance,
-                cache_dir=cache_dir
-            )
-            results[code] = hurricane_results
-        except Exception as e:
-            print(f"  ✗ Error processing {name} ({code}): {e}")
-            results[code] = {
-                'hurricane': None,
-                'ships': None,
-                'glm': None
-            }
-            continue
+                hurricane_info=hurricanes_df.loc[[code]],
+                glm_bin_workers=glm_bin_workers
+            )))
+        
+        for code, name, future in futures:
+            try:
+                results[code] = future.result()
+            except Exception as e:
+                print(f"  ✗ Error processing {name} ({code}): {e}")
+                results[code] = {
+                    'hurricane': None,
+                    'ships': None,
+                    'glm': None
+                }
     
     # Print summary
     successful_hurricanes = sum(1 for r in results.values() if r.get('hurricane') is not None)
@@ -3,82 +3,73 @@ Helper functions for SHIPS data.
 """
 
 import os
+import re
 import pandas as pd
+import numpy as np
 import fsspec
 from datetime import datetime
-from helpers.hurricane_helpers import get_hurricane_bin_midpoint_times, get_hurricane_bin_start_times, get_hurricane_bin_end_times
+from helpers.time_helpers import get_bins_midpoint_times, get_bins_start_times, get_bins_end_times
+from helpers.hurricane_helpers import _load_hurricane_list
 from constants import TS_MIN, TS_MAX, DEFAULT_REGION, ATL_SHIPS_URL, NE_PAC_SHIPS_URL, DEFAULT_NN_TOLERANCE
 
 # Helper functions to read SHIPS data
 
-def _count_entries_in_range(ships_url):
+#TS_MIN and TS_MAX as (year, month, day, hour, minute, second, microsecond)
+#tuples, which order the same way as the datetimes themselves
+_TS_MIN_FIELDS = TS_MIN.timetuple()[:6] + (TS_MIN.microsecond,)
+_TS_MAX_FIELDS = TS_MAX.timetuple()[:6] + (TS_MAX.microsecond,)
+
+def _parse_ships_time_fields(ts_day, ts_hr):
     """
-    Helper function to count how many entries are in the time range.
-    This allows us to show percentage progress.
+    Helper function to turn a SHIPS HEAD line date (YYMMDD) and hour (HH) into
+    a (year, month, day, hour, minute, second, microsecond) tuple that can be
+    compared against _TS_MIN_FIELDS/_TS_MAX_FIELDS without building a datetime.
+    Two-digit years are read like strptime's %y (69-99 are 19xx, 00-68 are
+    20xx). The fields aren't checked to be a valid date (datetime(*fields)
+    does that).
+
+    Raises:
+        ValueError if the date or hour aren't numbers of the right width
     """
-    count = 0
-    with fsspec.open(ships_url, mode="rt") as fobj:
-        while True:
-            result = find_ships_code(fobj, 'HEAD')
-            if result is None:
-                break
-            fobj, header_split = result
-            
-            try:
-                hurr_name, ts_day, ts_hr, max_sust, lat_hem, lon_hem, min_pres,\
-                hurr_code, line_code = header_split
-            except (ValueError, IndexError):
-                continue
-
-            try:
-                ts_full = datetime.strptime((ts_day+ts_hr),"%y%m%d%H")
-            except (ValueError, TypeError):
-                continue
-                
-            if (ts_full >= TS_MIN) and (ts_full <= TS_MAX):
-                count += 1
-                # Skip to next section
-                result = find_ships_code(fobj, 'LAST')
-                if result is not None:
-                    fobj, last_split = result
-            else:
-                # Skip to next section
-                result = find_ships_code(fobj, 'LAST')
-                if result is not None:
-                    fobj, last_split = result
-    
-    return count
+    if len(ts_day) != 6 or len(ts_hr) != 2:
+        raise ValueError(f"Invalid SHIPS time {ts_day} {ts_hr}")
+    year = int(ts_day[0:2])
+    year += 1900 if year >= 69 else 2000
+    return (year, int(ts_day[2:4]), int(ts_day[4:6]), int(ts_hr), 0, 0, 0)
 
-def find_ships_code(fobj, desired_code):
+#End of a SHIPS data file section (the line with code LAST)
+_SHIPS_SECTION_END = re.compile(r'\sLAST[ \t\r]*(?:\n|$)')
+
+def find_ships_code(lines, desired_code):
     """
     Helper function for finding a specific line code in SHIPS data files
 
     Args:
-        fobj: data file with current pointer
+        lines: iterator over the lines of a data file section, positioned at
+            the current line
         desired_code: line code of next line we're interested in. We'll just scan
             through the file until we find a line with that code
     
     Returns:
-        Returns that line once we find it. If no line is found, returns None
+        Returns the lines iterator and that line (split into fields) once we
+        find it. If no line is found, returns None
     """
     #Loop through lines of file
-    while True:
-        ships_info = fobj.readline()
-        #print(ships_info)
-        #If no line found, we have reached the end of the file. In the run of
-        #this program, that should only occur at the end of a section (we would
-        #be looking for code 'HEAD' in that instance)
-        if not ships_info:
-            if desired_code != 'HEAD':
-                print("SHIPS Error: something went wrong while parsing ships data file")
-            return None
-        
-        ships_info_split = ships_info.split()
-        line_code = ships_info_split[-1]
-        if not line_code == desired_code:
+    for ships_info in lines:
+        #The line code is the last field, so check the end of the line before
+        #splitting it (only lines that might match get split)
+        if not ships_info.rstrip().endswith(desired_code):
             continue
-        else:
-            return fobj, ships_info_split
+        ships_info_split = ships_info.split()
+        if ships_info_split[-1] == desired_code:
+            return lines, ships_info_split
+
+    #If no line found, we have reached the end of the section. In the run of
+    #this program, that should only occur after the last section of the file
+    #(we would be looking for code 'HEAD' in that instance)
+    if desired_code != 'HEAD':
+        print("SHIPS Error: something went wrong while parsing ships data file")
+    return None
 
 # Functions to save all SHIPS data
 def read_ships_data(region=None):
@@ -105,70 +96,77 @@ def read_ships_data(region=None):
 
     print(f"Reading SHIPS data from {ships_url}")
     print(f"Time range: {TS_MIN} to {TS_MAX}")
-    print("Counting entries in time range...")
-    
-    # Count total entries in range for progress reporting
-    total_entries = _count_entries_in_range(ships_url)
-    print(f"Found {total_entries} entries in time range. Processing...")
     
     ships_info_array = []
     processed_count = 0
     skipped_count = 0
 
-    with fsspec.open(ships_url, mode="rt") as fobj:
-        while True:
-            result = find_ships_code(fobj, 'HEAD')
-            if result is None:
-                break
-            fobj, header_split = result
-            
-            try:
-                hurr_name, ts_day, ts_hr, max_sust, lat_hem, lon_hem, min_pres,\
-                hurr_code, line_code = header_split
-            except (ValueError, IndexError):
-                continue
-
-            try:
-                ts_full = datetime.strptime((ts_day+ts_hr),"%y%m%d%H")
-            except (ValueError, TypeError):
-                continue
-                
-            if ((ts_full < TS_MIN) or (ts_full > TS_MAX)):
-                skipped_count += 1
-                continue
-            
-            result = find_ships_code(fobj, 'SHRD')
-            if result is None:
-                continue
-            fobj, shearmag_split = result
-            try:
-                shear_850_200_mag = float(shearmag_split[0])/10
-            except (ValueError, IndexError):
-                continue
-
-            result = find_ships_code(fobj, 'SHTD')
-            if result is None:
-                continue
-            fobj, sheardir_split = result
-            try:
-                shear_850_200_dir = sheardir_split[0]
-            except IndexError:
-                continue
-
-            result = find_ships_code(fobj, 'LAST')
-            if result is not None:
-                fobj, last_split = result
-
-            ships_info_array.append([hurr_code, ts_full, shear_850_200_mag, shear_850_200_dir])
-            processed_count += 1
+    # Download the whole file in one request and parse it from memory, rather
+    # than reading it line by line from the remote file. The raw file is kept
+    # in a local cache (data/cache/ships) so reruns don't download it again
+    with fsspec.open(f"simplecache::{ships_url}", mode="rt",
+                     simplecache={'cache_storage': 'data/cache/ships'}) as fobj:
+        ships_text = fobj.read()
+
+    # Split the file into its sections (HEAD line through LAST line, one per
+    # storm and time) up front, so sections outside the time range are skipped
+    # after reading their HEAD line instead of scanning every line in them
+    for section in _SHIPS_SECTION_END.split(ships_text):
+        lines = iter(section.splitlines())
+        result = find_ships_code(lines, 'HEAD')
+        if result is None:
+            continue
+        lines, header_split = result
+        
+        try:
+            hurr_name, ts_day, ts_hr, max_sust, lat_hem, lon_hem, min_pres,\
+            hurr_code, line_code = header_split
+        except (ValueError, IndexError):
+            continue
+
+        try:
+            ts_fields = _parse_ships_time_fields(ts_day, ts_hr)
+        except (ValueError, TypeError):
+            continue
             
-            if total_entries > 0:
-                percentage = (processed_count / total_entries) * 100
-                update_interval = max(10, total_entries // 10)
-                if processed_count % update_interval == 0:
-                    print(f"  Progress: {processed_count}/{total_entries} ({percentage:.1f}%)", end='\r')
-    
-    print(f"\nCompleted: Processed {processed_count}/{total_entries} entries, skipped {skipped_count} entries")
+        #Check the time range on the integer fields, so entries outside of it
+        #never need a datetime
+        if ((ts_fields < _TS_MIN_FIELDS) or (ts_fields > _TS_MAX_FIELDS)):
+            skipped_count += 1
+            continue
+        
+        try:
+            ts_full = datetime(*ts_fields)
+        except ValueError:
+            continue
+        
+        result = find_ships_code(lines, 'SHRD')
+        if result is None:
+            continue
+        lines, shearmag_split = result
+        try:
+            shear_850_200_mag = float(shearmag_split[0])/10
+        except (ValueError, IndexError):
+            continue
+
+        result = find_ships_code(lines, 'SHTD')
+        if result is None:
+            continue
+        lines, sheardir_split = result
+        try:
+            shear_850_200_dir = sheardir_split[0]
+        except IndexError:
+            continue
+
+        ships_info_array.append([hurr_code, ts_full, shear_850_200_mag, shear_850_200_dir])
+        processed_count += 1
+        
+        # Report progress as we go (the file is only read once, so the
+        # total number of entries in range isn't known up front)
+        if processed_count % 500 == 0:
+            print(f"  Progress: {processed_count} entries processed", end='\r')
+
+    print(f"\nCompleted: Processed {processed_count} entries, skipped {skipped_count} entries")
     
     #Convert ships info array to dataframe
     ships_info_df = pd.DataFrame(ships_info_array,
@@ -176,6 +174,10 @@ def read_ships_data(region=None):
                                             'Shear Magnitude (kts)',
                                             'Shear Direction (deg)'])
     
+    #Shear directions are parsed as strings; store them as (small) integers
+    ships_info_df['Shear Direction (deg)'] = pd.to_numeric(ships_info_df['Shear Direction (deg)'],
+                                                           errors='coerce', downcast='integer')
+    
     return ships_info_df
 
 def save_ships_data(region=None):
@@ -195,12 +197,121 @@ def save_ships_data(region=None):
     
     # Store the data in a csv file
     csv_path = f'data/global/ships/{region}_ships_data_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    ships_df.to_csv(csv_path, index=False)
+    # Write to a temporary file and rename it into place, so other processes
+    # never read a partially written file
+    tmp_path = f'{csv_path}.{os.getpid()}.tmp'
+    ships_df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, csv_path)
     print(f"Saved SHIPS data to {csv_path}")
+    
+    # Also save a Parquet copy, which is much faster to load back than
+    # re-parsing the CSV (see _load_ships_data)
+    parquet_path = csv_path.replace('.csv', '.parquet')
+    tmp_path = f'{parquet_path}.{os.getpid()}.tmp'
+    ships_df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, parquet_path)
+    _SHIPS_DATA_CACHE[region] = ships_df
     return ships_df
 
+#SHIPS data already loaded in this process, keyed by region
+_SHIPS_DATA_CACHE = {}
+
+def _load_ships_data(region):
+    """
+    Load SHIPS data CSV file, creating it if it doesn't exist. Each region is
+    only loaded once per process (later calls return the same DataFrame, so
+    callers must not modify it in place).
+
+    Args:
+        region: Region must be either "atl" (Atlantic) or "pac" (Pacific)
+
+    Returns:
+        pandas.DataFrame with SHIPS data (filtered to TS_MIN to TS_MAX from constants)
+    """
+    if region in _SHIPS_DATA_CACHE:
+        return _SHIPS_DATA_CACHE[region]
+
+    # CSV file path (and the Parquet copy saved next to it)
+    csv_filename = f'data/global/ships/{region}_ships_data_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
+    parquet_filename = csv_filename.replace('.csv', '.parquet')
+
+    # Try to load Parquet, then CSV, create if neither exists
+    if os.path.exists(parquet_filename):
+        ships_data_df = pd.read_parquet(parquet_filename)
+        print(f"Read ships data from {parquet_filename}")
+    elif os.path.exists(csv_filename):
+        ships_data_df = pd.read_csv(csv_filename, parse_dates=['Timestamp'], engine='pyarrow')
+        print(f"Read ships data from {csv_filename}")
+        tmp_path = f'{parquet_filename}.{os.getpid()}.tmp'
+        ships_data_df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, parquet_filename)
+    else:
+        print(f"SHIPS data not found, downloading and saving to {csv_filename}")
+        ships_data_df = save_ships_data(region)
+
+    _SHIPS_DATA_CACHE[region] = ships_data_df
+    return ships_data_df
+
+#SHIPS data split by hurricane code, keyed by region
+_SHIPS_DATA_BY_CODE = {}
+
+def _ships_data_by_code(region):
+    """
+    Get the SHIPS data for a region split by hurricane code (each storm sorted
+    by timestamp, as merge_asof requires). The split is done once per process,
+    so each lookup is a dictionary access instead of a scan over every storm.
+
+    Args:
+        region: Region must be either "atl" (Atlantic) or "pac" (Pacific)
+
+    Returns:
+        Dictionary mapping hurricane codes to their SHIPS DataFrames
+        (shared, so callers must not modify them in place)
+    """
+    df = _load_ships_data(region)
+
+    # Rebuild if the region's SHIPS data was reloaded or re-saved
+    cached = _SHIPS_DATA_BY_CODE.get(region)
+    if cached is None or cached[0] is not df:
+        sorted_df = df.sort_values('Timestamp', kind='stable')
+        cached = (df, dict(tuple(sorted_df.groupby('Hurricane Code', sort=False))))
+        _SHIPS_DATA_BY_CODE[region] = cached
+    return cached[1]
+
 # Functions to interpolate SHIPS data for a given hurricane
 
+def _nearest_ships_index(ships_times, bin_times, nn_tolerance):
+    """
+    Helper function to find the nearest SHIPS entry to each bin time. Matches
+    pd.merge_asof(direction="nearest", tolerance=nn_tolerance): ties go to the
+    earlier entry and exact matches to the last of any duplicates.
+
+    Args:
+        ships_times: Sorted SHIPS timestamps (Series)
+        bin_times: Bin timestamps to match (Series)
+        nn_tolerance: Maximum allowable time from nearest SHIPS data
+
+    Returns:
+        Array with the position of the nearest SHIPS entry for each bin, or -1
+        if there is no entry within nn_tolerance
+    """
+    ships_ns = ships_times.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    bin_ns = bin_times.to_numpy(dtype='datetime64[ns]').astype(np.int64)
+    n = len(ships_ns)
+    if n == 0:
+        return np.full(len(bin_ns), -1)
+
+    #Last entry at or before each bin time, and first entry at or after it
+    before = np.searchsorted(ships_ns, bin_ns, side='right') - 1
+    after = np.searchsorted(ships_ns, bin_ns, side='left')
+    before_dist = np.where(before >= 0, bin_ns - ships_ns[np.maximum(before, 0)], np.iinfo(np.int64).max)
+    after_dist = np.where(after < n, ships_ns[np.minimum(after, n - 1)] - bin_ns, np.iinfo(np.int64).max)
+
+    use_after = after_dist < before_dist
+    nearest_idx = np.where(use_after, np.minimum(after, n - 1), np.maximum(before, 0))
+    has_match = np.where(use_after, after_dist, before_dist) <= pd.Timedelta(nn_tolerance).value
+    return np.where(has_match, nearest_idx, -1)
+
 def interpolate_ships_info(ships_data_df, bin_times, bin_starts, bin_ends, nn_tolerance):
     """
     Interpolate hurricane data df to get storm info at specified times.
@@ -226,26 +337,23 @@ def interpolate_ships_info(ships_data_df, bin_times, bin_starts, bin_ends, nn_to
     #Initialize df to return
     ships_interp_df = pd.DataFrame(bin_times, columns = ['Timestamp'])
 
-    #Turn timestamp lists into numerical format
-    bin_times_num = [bin_time.timestamp() for bin_time in bin_times]
-    bin_starts_num = [bin_start.timestamp() for bin_start in bin_starts]
-    bin_ends_num = [bin_end.timestamp() for bin_end in bin_ends]
-    hurricane_data_ts_num = [ts.timestamp() for ts in ships_data_df['Timestamp']]
-    
-    #Assign shear magnitude and direction to nearest neighbor
-    ships_interp_df['Shear Magnitude (kts)'] = pd.merge_asof(ships_interp_df['Timestamp'], 
-                                                                 ships_data_df[["Timestamp", "Shear Magnitude (kts)"]], 
-                                                                 on="Timestamp", direction="nearest", 
-                                                                 tolerance=nn_tolerance)['Shear Magnitude (kts)']
+    #The nearest-entry search needs the SHIPS entries in time order (stable
+    #sort keeps duplicates in file order)
+    if not ships_data_df['Timestamp'].is_monotonic_increasing:
+        ships_data_df = ships_data_df.sort_values('Timestamp', kind='stable')
 
-    ships_interp_df['Shear Direction (deg)'] = pd.merge_asof(ships_interp_df['Timestamp'], 
-                                                                 ships_data_df[["Timestamp", "Shear Direction (deg)"]], 
-                                                                 on="Timestamp", direction="nearest",
-                                                                  tolerance=nn_tolerance)['Shear Direction (deg)']     
+    #Assign shear magnitude and direction to nearest neighbor (both columns
+    #matched in one pass)
+    #(bins with no SHIPS data within nn_tolerance get -1, which reindexes to nan)
+    nearest_idx = _nearest_ships_index(ships_data_df['Timestamp'],
+                                       ships_interp_df['Timestamp'],
+                                       nn_tolerance)
+    for column in ['Shear Magnitude (kts)', 'Shear Direction (deg)']:
+        ships_interp_df[column] = ships_data_df[column].reset_index(drop=True).reindex(nearest_idx).to_numpy()
 
     return ships_interp_df
 
-def interpolate_ships_info_for_hurricane(hurricane_code, nn_tolerance=None, region=None, time_interval=30):
+def interpolate_ships_info_for_hurricane(hurricane_code, nn_tolerance=None, region=None, time_interval=30, hurricane_info=None):
     """
     Interpolate SHIPS data for a given hurricane.
 
@@ -254,6 +362,8 @@ def interpolate_ships_info_for_hurricane(hurricane_code, nn_tolerance=None, regi
         nn_tolerance: Maximum allowable time from nearest SHIPS data (defaults to DEFAULT_NN_TOLERANCE from constants)
         region: Region must be either "atl" (Atlantic) or "pac" (Pacific) (defaults to DEFAULT_REGION from constants)
         time_interval: Time interval in minutes for bins (default: 30)
+        hurricane_info: Row(s) of the hurricane list for this hurricane. If None,
+            the hurricane list CSV is loaded and searched for hurricane_code
 
     Returns:
         Path to the saved interpolated data
@@ -265,40 +375,45 @@ def interpolate_ships_info_for_hurricane(hurricane_code, nn_tolerance=None, regi
         nn_tolerance = DEFAULT_NN_TOLERANCE
     
     # Get hurricane name and year from the hurricane list
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
-    hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
+    if hurricane_info is None:
+        hurricanes_df = _load_hurricane_list(region)
+        hurricane_info = hurricanes_df[hurricanes_df['code'] == hurricane_code]
     
     if len(hurricane_info) == 0:
         raise ValueError(f"Hurricane code {hurricane_code} not found in hurricane list.")
     
-    hurricane_name = hurricane_info['name'].iloc[0]
-    hurricane_start_year = int(hurricane_info['year'].iloc[0])
+    # Look up the hurricane's SHIPS data (empty if SHIPS has no entries for it)
+    ships_data_df = _ships_data_by_code(region).get(hurricane_code, _load_ships_data(region).iloc[:0])
+
+    return _interpolate_ships_info_for_hurricane(hurricane_info.iloc[0], ships_data_df, nn_tolerance, time_interval)
+
+def _interpolate_ships_info_for_hurricane(hurricane_row, ships_data_df, nn_tolerance, time_interval):
+    """
+    Interpolate and save SHIPS data for a hurricane whose hurricane list entry
+    and SHIPS data are already loaded.
+
+    Args:
+        hurricane_row: Row of the hurricane list CSV for the hurricane (any
+            mapping with 'code', 'name', 'year', 'start_date' and 'end_date')
+        ships_data_df: SHIPS DataFrame for the hurricane, sorted by timestamp
+        nn_tolerance: Maximum allowable time from nearest SHIPS data
+        time_interval: Time interval in minutes for bins
+
+    Returns:
+        Path to the saved interpolated data
+    """
+    hurricane_name = hurricane_row['name']
+    hurricane_start_year = int(hurricane_row['year'])
     
-    # Get bin times using the new helper functions
-    bin_times = get_hurricane_bin_midpoint_times(hurricane_code, region, time_interval)
-    bin_starts = get_hurricane_bin_start_times(hurricane_code, region, time_interval)
-    bin_ends = get_hurricane_bin_end_times(hurricane_code, region, time_interval)
+    # Create bins from the hurricane's start and end dates
+    bin_times = get_bins_midpoint_times(hurricane_row['start_date'], hurricane_row['end_date'], time_interval)
+    bin_starts = get_bins_start_times(hurricane_row['start_date'], hurricane_row['end_date'], time_interval)
+    bin_ends = get_bins_end_times(hurricane_row['start_date'], hurricane_row['end_date'], time_interval)
     
     # Create the directory path to store the interpolated data
     destination_path = f'data/storms/{hurricane_name}_{hurricane_start_year}/ships'
     os.makedirs(destination_path, exist_ok=True)
 
-    # Try reading ships data if it doesn't exist, call save_ships_data
-    csv_filename = f'data/global/ships/{region}_ships_data_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    try:
-        ships_data_df = pd.read_csv(csv_filename, parse_dates=['Timestamp'])
-        print(f"Read ships data from {csv_filename}")
-    except:
-        print(f"SHIPS data not found, downloading and saving to {csv_filename}")
-        ships_data_df = save_ships_data(region)
-
-    # Filter the SHIPS data to only include the hurricane
-    ships_data_df = ships_data_df[ships_data_df['Hurricane Code'] == hurricane_code]
-
     # Interpolate the SHIPS data
     ships_interp_df = interpolate_ships_info(ships_data_df, bin_times, bin_starts, bin_ends, nn_tolerance)
 
@@ -328,11 +443,7 @@ def interpolate_all_hurricanes_ships(region=None, time_interval=30, nn_tolerance
         nn_tolerance = DEFAULT_NN_TOLERANCE    
     
     # Load hurricane list
-    list_csv_path = f'data/global/hurricane/{region}_hurricane_list_{TS_MIN.strftime("%Y%m%d")}_{TS_MAX.strftime("%Y%m%d")}.csv'
-    if not os.path.exists(list_csv_path):
-        raise FileNotFoundError(f"Hurricane list CSV not found at {list_csv_path}. Run list_all_hurricanes(region='{region}') first.")
-    
-    hurricanes_df = pd.read_csv(list_csv_path, parse_dates=['start_date', 'end_date'])
+    hurricanes_df = _load_hurricane_list(region)
     
     # Filter by region (codes starting with AL for atl, EP for pac)
     if region == "atl":
@@ -347,17 +458,25 @@ def interpolate_all_hurricanes_ships(region=None, time_interval=30, nn_tolerance
     
     print(f"Processing SHIPS data for {total} hurricanes from {region} region...")
     
-    for idx, row in hurricanes_df.iterrows():
+    # Load the SHIPS data once and split it by hurricane (instead of
+    # reloading the full CSV for every hurricane)
+    ships_by_code = _ships_data_by_code(region)
+    no_ships_data = _load_ships_data(region).iloc[:0]
+    
+    # Interpolate one hurricane at a time - the per-hurricane work is small,
+    # so a process pool costs more (spawning workers, pickling the SHIPS rows
+    # and results) than it saves
+    for idx, row in enumerate(hurricanes_df.to_dict('records')):
         code = row['code']
         name = row['name']
         print(f"  [{idx+1}/{total}] Processing {name} ({code})...")
         
         try:
-            destination_path = interpolate_ships_info_for_hurricane(
-                code,
-                nn_tolerance=nn_tolerance,
-                region=region,
-                time_interval=time_interval
+            destination_path = _interpolate_ships_info_for_hurricane(
+                row,
+                ships_by_code.get(code, no_ships_data),
+                nn_tolerance,
+                time_interval
             )
             results[code] = destination_path
         except Exception as e:
@@ -3,6 +3,23 @@ Helper functions for working with dates.
 '''
 
 from datetime import datetime, timedelta
+from functools import lru_cache
+import pandas as pd
+
+@lru_cache(maxsize=256)
+def _bins_midpoint_index(start_datetime, end_datetime, time_interval):
+    """
+    Helper function that builds the bin midpoint times as a DatetimeIndex. The
+    result is cached, so the midpoint, start and end time functions only build
+    the bins once for each hurricane (DatetimeIndex is immutable, so sharing
+    it is safe).
+    """
+    #We want central times of bins (i.e., 12:15 AM, 12:45 AM, etc. for
+    #30-minute bins). This expression finds the first one after start_datetime
+    first_bin = start_datetime + timedelta(minutes = ((((time_interval/2) - start_datetime.minute) % time_interval) % time_interval))
+
+    #Times every time_interval minutes from first_bin until reaching end_datetime
+    return pd.date_range(first_bin, end_datetime, freq=pd.Timedelta(minutes=time_interval), inclusive='left')
 
 def get_bins_midpoint_times(start_datetime, end_datetime, time_interval):
     """
@@ -16,21 +33,7 @@ def get_bins_midpoint_times(start_datetime, end_datetime, time_interval):
     Returns:
         List of bin midpoint datetimes between start and end datetimes
     """
-    #list of bin midpoint times (to fill and return)
-    bin_times = []
-
-    #We want central times of bins (i.e., 12:15 AM, 12:45 AM, etc. for
-    #30-minute bins). This expression finds the first one after start_datetime
-    first_bin = start_datetime + timedelta(minutes = ((((time_interval/2) - start_datetime.minute) % time_interval) % time_interval))
-
-    
-    #Add times every time_interval minutes until reaching end_datetime
-    curr_time = first_bin
-    while curr_time < end_datetime:
-        bin_times.append(curr_time)
-        curr_time += timedelta(minutes = time_interval)
-
-    return bin_times
+    return list(_bins_midpoint_index(start_datetime, end_datetime, time_interval))
 
 def get_bins_start_times(start_datetime, end_datetime, time_interval):
     """
@@ -44,8 +47,8 @@ def get_bins_start_times(start_datetime, end_datetime, time_interval):
     Returns:
         List of bin start datetimes (midpoint - time_interval/2)
     """
-    midpoint_times = get_bins_midpoint_times(start_datetime, end_datetime, time_interval)
-    return [midpoint - timedelta(minutes=time_interval/2) for midpoint in midpoint_times]
+    midpoint_times = _bins_midpoint_index(start_datetime, end_datetime, time_interval)
+    return list(midpoint_times - timedelta(minutes=time_interval/2))
 
 def get_bins_end_times(start_datetime, end_datetime, time_interval):
     """
@@ -59,5 +62,29 @@ def get_bins_end_times(start_datetime, end_datetime, time_interval):
     Returns:
         List of bin end datetimes (midpoint + time_interval/2)
     """
-    midpoint_times = get_bins_midpoint_times(start_datetime, end_datetime, time_interval)
-    return [midpoint + timedelta(minutes=time_interval/2) for midpoint in midpoint_times]
+    midpoint_times = _bins_midpoint_index(start_datetime, end_datetime, time_interval)
+    return list(midpoint_times + timedelta(minutes=time_interval/2))
+
+def get_list_of_hours_between_dates(start_date, start_hour, end_date, end_hour):
+    """
+    Get every hour between two dates, formatted like the GLM bucket layout
+    (GLM-L2-LCFA/YYYY/DDD/HH/).
+
+    Args:
+        start_date: Start date (date, datetime or date string)
+        start_hour: Hour of start_date to start from (0-23)
+        end_date: End date (date, datetime or date string)
+        end_hour: Hour of end_date to end at, inclusive (0-23)
+
+    Returns:
+        List of (year, day of year, hour) tuples of zero-padded strings
+        ('YYYY', 'DDD', 'HH')
+    """
+    #Build all the hours in one call and format them column-wise
+    hours = pd.date_range(pd.Timestamp(start_date).normalize() + pd.Timedelta(hours=start_hour),
+                          pd.Timestamp(end_date).normalize() + pd.Timedelta(hours=end_hour),
+                          freq='h')
+    years = hours.strftime('%Y')
+    days_of_year = hours.strftime('%j')
+    hours_of_day = hours.strftime('%H')
+    return list(zip(years, days_of_year, hours_of_day))
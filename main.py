@@ -37,11 +37,11 @@ if __name__ == "__main__":
     download_all_data_for_hurricane(IAN)
 
     # Analyze quality flag counts for NICOLE_2022
-    glm_csv_path = "data/storms/NICOLE_2022/glm/groups.csv"
+    glm_parquet_path = "data/storms/NICOLE_2022/glm/groups.parquet"
     
-    if os.path.exists(glm_csv_path):
-        print(f"Reading GLM data from {glm_csv_path}...")
-        glm_df = pd.read_csv(glm_csv_path)
+    if os.path.exists(glm_parquet_path):
+        print(f"Reading GLM data from {glm_parquet_path}...")
+        glm_df = pd.read_parquet(glm_parquet_path)
         
         print(f"\nTotal lightning groups: {len(glm_df)}")
         print("\nQuality Flag Value Counts:")
@@ -52,7 +52,7 @@ if __name__ == "__main__":
             print(f"  {flag_value}: {count:,} ({percentage:.2f}%)")
         print("=" * 50)
     else:
-        print(f"GLM data file not found at {glm_csv_path}")
+        print(f"GLM data file not found at {glm_parquet_path}")
 
 
     # # refresh the besttrack csv files